@@ -1,9 +1,19 @@
+import asyncio
+import functools
+import inspect
+import io
+import itertools
+import operator
 import os
 import re
 import sys
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from alpaca.common.enums import SupportedCurrencies
 from alpaca.common.exceptions import APIError
@@ -13,7 +23,6 @@ from alpaca.data.historical.stock import (
     StockHistoricalDataClient,
     StockLatestTradeRequest,
 )
-from alpaca.data.live.stock import StockDataStream
 from alpaca.data.requests import (
     OptionLatestQuoteRequest,
     OptionSnapshotRequest,
@@ -37,17 +46,19 @@ from alpaca.trading.enums import (
     QueryOrderStatus,
     TimeInForce,
 )
-from alpaca.trading.models import Order
+from alpaca.trading.models import Order, TradeAccount
 from alpaca.trading.requests import (
     ClosePositionRequest,
     CreateWatchlistRequest,
     GetAssetsRequest,
+    GetCalendarRequest,
     GetCorporateAnnouncementsRequest,
     GetOptionContractsRequest,
     GetOrdersRequest,
     LimitOrderRequest,
     MarketOrderRequest,
     OptionLegRequest,
+    OrderRequest,
     StopLimitOrderRequest,
     StopOrderRequest,
     TrailingStopOrderRequest,
@@ -55,9 +66,72 @@ from alpaca.trading.requests import (
 )
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib json decoder
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # optional speedup, not available on Windows
+    uvloop = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    from alpaca.data.live.stock import StockDataStream
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Size the default executor used by ``asyncio.to_thread`` for SDK calls."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=32, thread_name_prefix="alpaca-sdk")
+    )
+    try:
+        yield
+    finally:
+        await _stock_bar_stream.close()
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+async def _run(fn: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs) -> _R:
+    """Run a blocking SDK call off the event loop, on the executor set above."""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def _tool_safe(
+    label: str,
+) -> Callable[[Callable[_P, Awaitable[str]]], Callable[_P, Awaitable[str]]]:
+    """Return exceptions raised by a tool as an ``Error {label}: ...`` reply.
+
+    ``label`` may name the tool's arguments, e.g. ``"cancelling order {order_id}"``.
+    Apply it below ``@mcp.tool()`` so FastMCP still sees the tool's signature.
+    """
+
+    def decorator(fn: Callable[_P, Awaitable[str]]) -> Callable[_P, Awaitable[str]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                arguments = signature.bind(*args, **kwargs).arguments
+                return f"Error {label.format_map(arguments)}: {str(e)}"
+
+        return wrapper
+
+    return decorator
+
 
 # Initialize FastMCP server
-mcp = FastMCP("alpaca-trading")
+mcp = FastMCP("alpaca-trading", lifespan=_lifespan)
 
 # Initialize Alpaca clients using environment variables
 # Import our .env file within the same directory
@@ -80,15 +154,688 @@ if not API_KEY or not API_SECRET:
 trade_client = TradingClient(API_KEY, API_SECRET, paper=ALPACA_PAPER_TRADE)
 # For historical market data
 stock_historical_data_client = StockHistoricalDataClient(API_KEY, API_SECRET)
-# For streaming market data
-stock_data_stream_client = StockDataStream(
-    API_KEY, API_SECRET, url_override=STREAM_DATA_WSS
-)
 # For option historical data
 option_historical_data_client = OptionHistoricalDataClient(
     api_key=API_KEY, secret_key=API_SECRET
 )
 
+
+class _OrjsonResponse(Response):
+    """``requests`` response that decodes JSON bodies with orjson."""
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return orjson.loads(self.content)
+
+
+class _OrjsonHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose responses decode JSON with orjson.
+
+    alpaca-py parses every REST payload through ``response.json()``; swapping
+    the decoder here speeds up large bar/trade responses without touching the
+    SDK itself.
+    """
+
+    def build_response(self, req: PreparedRequest, resp: Any) -> Response:
+        response = super().build_response(req, resp)
+        response.__class__ = _OrjsonResponse
+        return response
+
+
+def _configure_http_session(client: Any) -> None:
+    """Size the SDK client's HTTP connection pool and keep connections alive.
+
+    alpaca-py issues every REST call through ``client._session`` (a
+    ``requests.Session``); mounting a larger pool lets concurrent tool calls
+    reuse warm TCP/TLS connections instead of opening new ones.
+    """
+    session = getattr(client, "_session", None)
+    if session is None:
+        return
+    adapter_cls = HTTPAdapter if orjson is None else _OrjsonHTTPAdapter
+    adapter = adapter_cls(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+
+
+for _client in (
+    trade_client,
+    stock_historical_data_client,
+    option_historical_data_client,
+):
+    _configure_http_session(_client)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_stock_data_stream_client() -> "StockDataStream":
+    """Create the streaming market data client on first use.
+
+    The websocket client is only needed by streaming tools, so its import and
+    construction are kept off the server's startup path.
+    """
+    from alpaca.data.live.stock import StockDataStream
+
+    # Credentials are validated at import time above
+    assert API_KEY is not None and API_SECRET is not None
+    return StockDataStream(API_KEY, API_SECRET, url_override=STREAM_DATA_WSS)
+
+
+class _StockBarStream:
+    """Shared live minute-bar stream that fans bars out to per-symbol subscribers.
+
+    A single background task owns the websocket connection (the SDK reconnects
+    with backoff on its own), so tool calls only change subscriptions instead of
+    opening a new connection each time. A symbol is subscribed with the SDK when
+    its first subscriber arrives and unsubscribed when the last one leaves.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[asyncio.Queue[Any]]] = {}
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _dispatch(self, bar: Any) -> None:
+        for queue in self._subscribers.get(bar.symbol, ()):
+            queue.put_nowait(bar)
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            error: Exception
+            try:
+                await _get_stock_data_stream_client()._run_forever()
+                # The SDK logs fatal errors such as "insufficient subscription"
+                # and returns instead of raising
+                error = ConnectionError(
+                    "stock data stream closed; check that your market data "
+                    "subscription includes live data"
+                )
+                delay = 1.0
+            except Exception as e:
+                print(f"Stock data stream error: {e}", file=sys.stderr)
+                error = e
+            for queues in self._subscribers.values():
+                for queue in queues:
+                    queue.put_nowait(error)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+            # Restarting with no subscribers would leave the SDK busy-waiting;
+            # the next subscribe() starts a fresh task instead
+            if not self._subscribers:
+                self._task = None
+                return
+
+    @asynccontextmanager
+    async def subscribe(self, symbol: str) -> AsyncIterator[asyncio.Queue[Any]]:
+        """Yield a queue that receives live minute bars for ``symbol``.
+
+        If the stream stops, the exception describing why is put on the queue
+        in place of a bar.
+        """
+        client = _get_stock_data_stream_client()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        async with self._lock:
+            subscribers = self._subscribers.setdefault(symbol, set())
+            subscribers.add(queue)
+            if len(subscribers) == 1:
+                # The SDK blocks on the stream's loop-bound future, so never
+                # call (un)subscribe from the event loop thread itself
+                try:
+                    await asyncio.to_thread(
+                        client.subscribe_bars, self._dispatch, symbol
+                    )
+                except BaseException:
+                    # Leave no dead queue behind, or later callers would skip
+                    # subscribing and wait on a symbol the SDK never streams
+                    del self._subscribers[symbol]
+                    raise
+            # Started on first use: the SDK busy-waits while nothing is subscribed
+            if self._task is None:
+                self._task = asyncio.create_task(self._run())
+
+        try:
+            yield queue
+        finally:
+            async with self._lock:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[symbol]
+                    await asyncio.to_thread(client.unsubscribe_bars, symbol)
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        await _get_stock_data_stream_client().stop_ws()
+        self._task.cancel()
+        self._task = None
+
+
+_stock_bar_stream = _StockBarStream()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``alpaca_mcp_server.stock_data_stream_client`` importable (PEP 562)
+    if name == "stock_data_stream_client":
+        return _get_stock_data_stream_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _TTLCache:
+    """Bounded LRU cache whose entries expire ``ttl`` seconds after insertion.
+
+    Concurrent misses for the same key share a single in-flight fetch.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._generation = 0
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, fetching it in a thread on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(fetch))
+            self._inflight[key] = task
+            task.add_done_callback(
+                functools.partial(self._store, key, self._generation)
+            )
+        # Shielded so one cancelled caller does not cancel the others' fetch
+        return await asyncio.shield(task)
+
+    def _store(self, key: Hashable, generation: int, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # A clear() while the fetch was running means its result may be stale
+        if generation != self._generation or task.cancelled() or task.exception():
+            return
+        self._entries[key] = (time.monotonic(), task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+
+def _is_bad_symbol_error(error: Exception) -> bool:
+    """Whether ``error`` is the API rejecting a symbol rather than the request."""
+    if not isinstance(error, APIError) or "symbol" not in str(error).lower():
+        return False
+    return error.status_code in (None, 400, 404, 422)
+
+
+class _RequestCoalescer:
+    """Merge concurrent single-symbol requests into one multi-symbol SDK call.
+
+    Symbols requested within ``window`` seconds of each other under the same
+    ``key`` are fetched together, and each caller receives the entry for its
+    own symbol. If the API rejects the combined request over a symbol, each
+    symbol is retried alone so a bad one only fails its own callers; any other
+    error (auth, rate limit, network) goes to every caller without a retry.
+    """
+
+    def __init__(self, window: float = 0.005) -> None:
+        self.window = window
+        self._batches: dict[Hashable, dict[str, list[asyncio.Future[Any]]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def fetch(
+        self,
+        symbol: str,
+        key: Hashable,
+        fetch: Callable[[list[str]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return ``{symbol: data}``, or an empty dict if the symbol has no data."""
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = {}
+            task = loop.create_task(self._flush(key, fetch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        future: asyncio.Future[Any] = loop.create_future()
+        batch.setdefault(symbol, []).append(future)
+        data = await future
+        return {symbol: data} if data is not None else {}
+
+    async def _flush(
+        self, key: Hashable, fetch: Callable[[list[str]], dict[str, Any]]
+    ) -> None:
+        await asyncio.sleep(self.window)
+        await self._resolve(self._batches.pop(key), fetch)
+
+    async def _resolve(
+        self,
+        batch: dict[str, list[asyncio.Future[Any]]],
+        fetch: Callable[[list[str]], dict[str, Any]],
+    ) -> None:
+        try:
+            results = await asyncio.to_thread(fetch, list(batch))
+        except Exception as e:
+            if len(batch) > 1 and _is_bad_symbol_error(e):
+                # The API rejects the whole request for one bad symbol, so
+                # retry each symbol alone and fail only its own callers
+                await asyncio.gather(
+                    *(
+                        self._resolve({symbol: futures}, fetch)
+                        for symbol, futures in batch.items()
+                    )
+                )
+                return
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for symbol, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results.get(symbol))
+
+
+_latest_data_coalescer = _RequestCoalescer()
+
+
+async def _fetch_latest_data(
+    symbol_or_symbols: str | list[str],
+    key: Hashable,
+    fetch: Callable[[list[str]], dict[str, Any]],
+) -> dict[str, Any]:
+    """Fetch latest-* market data, batching concurrent single-symbol calls."""
+    if isinstance(symbol_or_symbols, str):
+        return await _latest_data_coalescer.fetch(symbol_or_symbols, key, fetch)
+    return await _run(fetch, symbol_or_symbols)
+
+
+# Account and position reads are repeated at sub-second cadence during LLM
+# tool loops; a short TTL collapses them without serving noticeably stale data.
+_account_cache = _TTLCache(maxsize=8, ttl=1.0)
+# Historical bars for the same symbol/timeframe/window, see get_stock_bars
+_bars_cache = _TTLCache(maxsize=32, ttl=15.0)
+# Asset metadata is effectively static within a session; the clock is polled
+# by strategies but only changes meaningfully at the open and close
+_asset_cache = _TTLCache(maxsize=4096, ttl=900.0)
+_clock_cache = _TTLCache(maxsize=1, ttl=5.0)
+# Option contract metadata (strikes, expirations, style, size) is static
+# intraday; snapshots are market data and only collapse back-to-back calls
+_option_contracts_cache = _TTLCache(maxsize=128, ttl=300.0)
+_option_snapshot_cache = _TTLCache(maxsize=128, ttl=1.0)
+
+# OCC option symbol: root (adjusted roots may carry a digit), YYMMDD expiry,
+# C/P, and the strike price times 1000 padded to eight digits
+_OCC_RE = re.compile(r"^[A-Z][A-Z0-9.]{0,5}\d{6}[CP]\d{8}$")
+
+# Timeframe strings accepted by parse_timeframe_with_enums: <number><unit>
+# where unit can be Min, Hour, Day, Week, Month (any case)
+_TIMEFRAME_RE = re.compile(r"^(\d+)(Min|Hour|Day|Week|Month)$", re.IGNORECASE)
+_PREDEFINED_TIMEFRAMES = {
+    "1Min": TimeFrame.Minute,
+    "1Hour": TimeFrame.Hour,
+    "1Day": TimeFrame.Day,
+    "1Week": TimeFrame.Week,
+    "1Month": TimeFrame.Month,
+}
+_TIMEFRAME_UNITS = {
+    "min": TimeFrameUnit.Minute,
+    "hour": TimeFrameUnit.Hour,
+    "day": TimeFrameUnit.Day,
+    "week": TimeFrameUnit.Week,
+    "month": TimeFrameUnit.Month,
+}
+
+# Largest amount accepted per unit: minutes 1-59, hours 1-23, and a
+# reasonable cap for days/weeks/months
+_TIMEFRAME_UNIT_LIMITS = {
+    TimeFrameUnit.Minute: 59,
+    TimeFrameUnit.Hour: 23,
+    TimeFrameUnit.Day: 365,
+    TimeFrameUnit.Week: 365,
+    TimeFrameUnit.Month: 365,
+}
+
+# Data API errors that mean the requested feed needs a paid subscription
+_SUB_ERR_RE = re.compile(
+    r"subscription.*(sip|premium)|(sip|premium).*subscription",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Model schemas are fixed for the life of the process, so probe optional
+# fields once instead of calling hasattr on every response
+_HAS_DAYTRADE_COUNT = "daytrade_count" in getattr(TradeAccount, "model_fields", {})
+_HAS_ORDER_FILL_FIELDS = {"filled_avg_price", "filled_at"} <= set(
+    getattr(Order, "model_fields", {})
+)
+
+# On free-threaded builds (3.13t+) large multi-symbol responses are rendered
+# in parallel on the worker pool; with a GIL that would only add overhead
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+_PARALLEL_FORMAT_MIN = 64
+
+# Shared headers for the list-style tool responses below
+_POSITIONS_HEADER = "Current Positions:\n-------------------\n"
+_HISTORY_RULE = "---------------------------------------------------\n"
+_RESULT_RULE = "-" * 30
+
+# Response templates, parsed once at import and filled with str.format
+_ACCOUNT_TMPL = """
+Account Information:
+-------------------
+Account ID: {id}
+Status: {status}
+Currency: {currency}
+Buying Power: ${buying_power:.2f}
+Cash: ${cash:.2f}
+Portfolio Value: ${portfolio_value:.2f}
+Equity: ${equity:.2f}
+Long Market Value: ${long_market_value:.2f}
+Short Market Value: ${short_market_value:.2f}
+Pattern Day Trader: {pattern_day_trader}
+Day Trades Remaining: {daytrade_count}
+"""
+
+# Numeric SDK fields, converted to float once per object before formatting
+_ACCOUNT_BALANCES = (
+    "buying_power",
+    "cash",
+    "portfolio_value",
+    "equity",
+    "long_market_value",
+    "short_market_value",
+)
+
+_OPEN_POSITION_VALUES = (
+    "market_value",
+    "avg_entry_price",
+    "current_price",
+    "unrealized_pl",
+)
+_POSITION_VALUES = (*_OPEN_POSITION_VALUES, "unrealized_plpc")
+
+_POSITION_ROW_TMPL = """
+Symbol: {symbol}
+Quantity: {qty} shares
+Market Value: ${market_value:.2f}
+Average Entry Price: ${avg_entry_price:.2f}
+Current Price: ${current_price:.2f}
+Unrealized P/L: ${unrealized_pl:.2f} ({unrealized_plpc:.2%})
+-------------------
+"""
+
+_OPEN_POSITION_TMPL = """
+Position Details for {symbol}:
+---------------------------
+Quantity: {quantity}
+Market Value: ${market_value:.2f}
+Average Entry Price: ${avg_entry_price:.2f}
+Current Price: ${current_price:.2f}
+Unrealized P/L: ${unrealized_pl:.2f}
+"""
+
+_STOCK_QUOTE_TMPL = """
+Latest Quote for {symbol}:
+------------------------
+Ask Price: ${ask_price:.2f}
+Bid Price: ${bid_price:.2f}
+Ask Size: {ask_size}
+Bid Size: {bid_size}
+Timestamp: {timestamp}
+"""
+
+_TRADE_ROW_TMPL = """
+Time: {trade.timestamp}
+Price: ${trade.price:.6f}
+Size: {trade.size}
+Exchange: {trade.exchange}
+ID: {trade.id}
+Conditions: {trade.conditions}
+-------------------
+"""
+
+_LATEST_TRADE_TMPL = """
+Latest Trade for {symbol}:
+---------------------------
+Time: {trade.timestamp}
+Price: ${trade.price:.6f}
+Size: {trade.size}
+Exchange: {trade.exchange}
+ID: {trade.id}
+Conditions: {trade.conditions}
+"""
+
+_LATEST_BAR_TMPL = """
+Latest Minute Bar for {symbol}:
+---------------------------
+Time: {bar.timestamp}
+Open: ${bar.open:.2f}
+High: ${bar.high:.2f}
+Low: ${bar.low:.2f}
+Close: ${bar.close:.2f}
+Volume: {bar.volume}
+"""
+
+_OHLCV_BAR_TMPL = """{bar_type}:
+  Open: ${open:.2f}, High: ${high:.2f}, Low: ${low:.2f},
+  Close: ${close:.2f}
+  Volume: {volume:,},
+  {time_label}: {time_str}
+
+"""
+
+_ORDER_PLACED_TMPL = """
+Order Placed Successfully:
+-------------------------
+Order ID: {order.id}
+Symbol: {order.symbol}
+Side: {order.side}
+Quantity: {order.qty}
+Type: {order.type}
+Time In Force: {order.time_in_force}
+Status: {order.status}
+Client Order ID: {order.client_order_id}
+"""
+
+_ORDER_CANCEL_TMPL = """
+Order Cancellation Result:
+------------------------
+Order ID: {response.id}
+Status: {status}
+"""
+
+_POSITION_CLOSED_TMPL = """
+Position Closed Successfully:
+----------------------------
+Symbol: {symbol}
+Order ID: {order.id}
+Status: {order.status}
+"""
+
+_ASSET_INFO_TMPL = """
+Asset Information for {symbol}:
+----------------------------
+Name: {asset.name}
+Exchange: {asset.exchange}
+Class: {asset.asset_class}
+Status: {asset.status}
+Tradable: {tradable}
+Marginable: {marginable}
+Shortable: {shortable}
+Easy to Borrow: {easy_to_borrow}
+Fractionable: {fractionable}
+"""
+
+_MARKET_CLOCK_TMPL = """
+Market Status:
+-------------
+Current Time: {clock.timestamp}
+Is Open: {is_open}
+Next Open: {clock.next_open}
+Next Close: {clock.next_close}
+"""
+
+# Filled from the SDK model's field dict, so placeholders are field names
+_ORDER_ROW_TMPL = """
+Symbol: {symbol}
+ID: {id}
+Type: {type}
+Side: {side}
+Quantity: {qty}
+Status: {status}
+Submitted At: {submitted_at}
+"""
+
+_OPTION_QUOTE_TMPL = """
+Latest Quote for {symbol}:
+------------------------
+Ask Price: ${quote.ask_price:.2f}
+Ask Size: {quote.ask_size}
+Ask Exchange: {quote.ask_exchange}
+Bid Price: ${quote.bid_price:.2f}
+Bid Size: {quote.bid_size}
+Bid Exchange: {quote.bid_exchange}
+Conditions: {quote.conditions}
+Tape: {quote.tape}
+Timestamp: {quote.timestamp}
+"""
+
+# Filled from the Greeks model's field dict
+_GREEKS_TMPL = """Greeks:
+  Delta: {delta:.4f}
+  Gamma: {gamma:.4f}
+  Rho: {rho:.4f}
+  Theta: {theta:.4f}
+  Vega: {vega:.4f}
+"""
+
+_OPTION_CONTRACT_TMPL = """
+Symbol: {contract.symbol}
+Name: {contract.name}
+Type: {contract.type}
+Strike Price: ${contract.strike_price:.2f}
+Expiration Date: {contract.expiration_date}
+Status: {contract.status}
+Root Symbol: {contract.root_symbol}
+Underlying Symbol: {contract.underlying_symbol}
+Exercise Style: {contract.style}
+Contract Size: {contract.size}
+Tradable: {tradable}
+Open Interest: {contract.open_interest}
+Close Price: ${close_price}
+Close Price Date: {contract.close_price_date}
+-------------------------
+"""
+
+_OPTION_ORDER_TMPL = """
+Option Market Order Placed Successfully:
+--------------------------------------
+Order ID: {order.id}
+Client Order ID: {order.client_order_id}
+Order Class: {order.order_class}
+Order Type: {order.type}
+Time In Force: {order.time_in_force}
+Status: {order.status}
+Quantity: {order.qty}
+Created At: {order.created_at}
+Updated At: {order.updated_at}
+"""
+
+_OPTION_ORDER_LEG_TMPL = """
+Symbol: {leg.symbol}
+Side: {leg.side}
+Ratio Quantity: {leg.ratio_qty}
+Status: {leg.status}
+Asset Class: {leg.asset_class}
+Created At: {leg.created_at}
+Updated At: {leg.updated_at}
+Filled Price: {filled_price}
+Filled Time: {filled_at}
+-------------------------
+"""
+
+_OPTION_ORDER_FILL_TMPL = """
+Symbol: {order.symbol}
+Side: {order.side}
+Filled Price: {filled_price}
+Filled Time: {filled_at}
+-------------------------
+"""
+
+_ASSET_ROW_TMPL = """Symbol: {asset.symbol}
+Name: {asset.name}
+Exchange: {asset.exchange}
+Class: {asset.asset_class}
+Status: {asset.status}
+Tradable: {tradable}
+------------------------------"""
+
+_ANNOUNCEMENT_ROW_TMPL = """
+ID: {id}
+Corporate Action ID: {corporate_action_id}
+Type: {ca_type}
+Sub Type: {ca_sub_type}
+Initiating Symbol: {initiating_symbol}
+Target Symbol: {target_symbol}
+Declaration Date: {declaration_date}
+Ex Date: {ex_date}
+Record Date: {record_date}
+Payable Date: {payable_date}
+Cash: {cash}
+Old Rate: {old_rate}
+New Rate: {new_rate}
+----------------------
+"""
+
+# Suffix for generated client_order_ids, unique even within one clock tick
+_ORDER_SEQ = itertools.count()
+
+# Order tool string arguments, resolved with one dict lookup per call. Both
+# the lower- and upper-case spellings are keys, so canonical input is found
+# without allocating a case-folded copy; anything else falls back to
+# normalizing first
+_TIF_MAP = {
+    name: tif
+    for tif in (
+        TimeInForce.DAY,
+        TimeInForce.GTC,
+        TimeInForce.OPG,
+        TimeInForce.CLS,
+        TimeInForce.IOC,
+        TimeInForce.FOK,
+    )
+    for name in (tif.value, tif.value.upper())
+}
+_SIDE_MAP = {
+    name: side
+    for side in (OrderSide.BUY, OrderSide.SELL)
+    for name in (side.value, side.value.upper())
+}
+_QUERY_STATUS_MAP = {
+    name: query_status
+    for query_status in (
+        QueryOrderStatus.OPEN,
+        QueryOrderStatus.CLOSED,
+        QueryOrderStatus.ALL,
+    )
+    for name in (query_status.value, query_status.value.upper())
+}
+
 # ============================================================================
 # Account Information Tools
 # ============================================================================
@@ -112,28 +859,17 @@ async def get_account_info() -> str:
             - Pattern Day Trader Status
             - Day Trades Remaining
     """
-    account = trade_client.get_account()
-
-    info = f"""
-            Account Information:
-            -------------------
-            Account ID: {account.id}
-            Status: {account.status}
-            Currency: {account.currency}
-            Buying Power: ${float(account.buying_power):.2f}
-            Cash: ${float(account.cash):.2f}
-            Portfolio Value: ${float(account.portfolio_value):.2f}
-            Equity: ${float(account.equity):.2f}
-            Long Market Value: ${float(account.long_market_value):.2f}
-            Short Market Value: ${float(account.short_market_value):.2f}
-            Pattern Day Trader: {'Yes' if account.pattern_day_trader else 'No'}
-            Day Trades Remaining: {
-                account.daytrade_count
-                if hasattr(account, 'daytrade_count')
-                else 'Unknown'
-            }
-            """
-    return info
+    account = await _account_cache.get_or_fetch(("account",), trade_client.get_account)
+
+    balances = {field: float(getattr(account, field)) for field in _ACCOUNT_BALANCES}
+    return _ACCOUNT_TMPL.format(
+        id=account.id,
+        status=account.status,
+        currency=account.currency,
+        **balances,
+        pattern_day_trader="Yes" if account.pattern_day_trader else "No",
+        daytrade_count=account.daytrade_count if _HAS_DAYTRADE_COUNT else "Unknown",
+    )
 
 
 @mcp.tool()
@@ -150,25 +886,22 @@ async def get_positions() -> str:
             - Current Price
             - Unrealized P/L
     """
-    positions = trade_client.get_all_positions()
+    positions = await _account_cache.get_or_fetch(
+        ("positions",), trade_client.get_all_positions
+    )
 
     if not positions:
         return "No open positions found."
 
-    result = "Current Positions:\n-------------------\n"
+    parts = [_POSITIONS_HEADER]
     for position in positions:
-        result += f"""
-                    Symbol: {position.symbol}
-                    Quantity: {position.qty} shares
-                    Market Value: ${float(position.market_value):.2f}
-                    Average Entry Price: ${float(position.avg_entry_price):.2f}
-                    Current Price: ${float(position.current_price):.2f}
-                    Unrealized P/L: ${float(position.unrealized_pl):.2f} (
-                        {float(position.unrealized_plpc) * 100:.2f}%
-                    )
-                    -------------------
-                    """
-    return result
+        values = {field: float(getattr(position, field)) for field in _POSITION_VALUES}
+        parts.append(
+            _POSITION_ROW_TMPL.format(
+                symbol=position.symbol, qty=position.qty, **values
+            )
+        )
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -184,23 +917,23 @@ async def get_open_position(symbol: str) -> str:
         str: Formatted string containing the position details or an error message
     """
     try:
-        position = trade_client.get_open_position(symbol)
+        position = await _account_cache.get_or_fetch(
+            ("position", symbol),
+            functools.partial(trade_client.get_open_position, symbol),
+        )
 
-        # Check if it's an options position by looking for the options symbol pattern
-        is_option = len(symbol) > 6 and any(c in symbol for c in ["C", "P"])
+        # Check if it's an options position by matching the OCC symbol format
+        is_option = _OCC_RE.match(symbol) is not None
 
         # Format quantity based on asset type
         quantity_text = f"{position.qty} contracts" if is_option else f"{position.qty}"
 
-        return f"""
-                Position Details for {symbol}:
-                ---------------------------
-                Quantity: {quantity_text}
-                Market Value: ${float(position.market_value):.2f}
-                Average Entry Price: ${float(position.avg_entry_price):.2f}
-                Current Price: ${float(position.current_price):.2f}
-                Unrealized P/L: ${float(position.unrealized_pl):.2f}
-                """
+        values = {
+            field: float(getattr(position, field)) for field in _OPEN_POSITION_VALUES
+        }
+        return _OPEN_POSITION_TMPL.format(
+            symbol=symbol, quantity=quantity_text, **values
+        )
     except Exception as e:
         return f"Error fetching position: {str(e)}"
 
@@ -211,12 +944,13 @@ async def get_open_position(symbol: str) -> str:
 
 
 @mcp.tool()
-async def get_stock_quote(symbol: str) -> str:
+async def get_stock_quote(symbol: str | list[str]) -> str:
     """
-    Retrieves and formats the latest quote for a stock.
+    Retrieves and formats the latest quote for one or more stocks.
 
     Args:
-        symbol (str): Stock ticker symbol (e.g., AAPL, MSFT)
+        symbol (str | list[str]): Stock ticker symbol or list of symbols
+            (e.g., AAPL or ['AAPL', 'MSFT'])
 
     Returns:
         str: Formatted string containing:
@@ -227,22 +961,32 @@ async def get_stock_quote(symbol: str) -> str:
             - Timestamp
     """
     try:
-        request_params = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-        quotes = stock_historical_data_client.get_stock_latest_quote(request_params)
+        quotes = await _fetch_latest_data(
+            symbol,
+            ("quote",),
+            lambda symbols: stock_historical_data_client.get_stock_latest_quote(
+                StockLatestQuoteRequest(symbol_or_symbols=symbols)
+            ),
+        )
 
-        if symbol in quotes:
-            quote = quotes[symbol]
-            return f"""
-                    Latest Quote for {symbol}:
-                    ------------------------
-                    Ask Price: ${quote.ask_price:.2f}
-                    Bid Price: ${quote.bid_price:.2f}
-                    Ask Size: {quote.ask_size}
-                    Bid Size: {quote.bid_size}
-                    Timestamp: {quote.timestamp}
-                    """
-        else:
-            return f"No quote data found for {symbol}."
+        symbols = [symbol] if isinstance(symbol, str) else symbol
+        results = []
+        for sym in symbols:
+            if sym in quotes:
+                quote = quotes[sym]
+                results.append(
+                    _STOCK_QUOTE_TMPL.format(
+                        symbol=sym,
+                        ask_price=quote.ask_price,
+                        bid_price=quote.bid_price,
+                        ask_size=quote.ask_size,
+                        bid_size=quote.bid_size,
+                        timestamp=quote.timestamp,
+                    )
+                )
+            else:
+                results.append(f"No quote data found for {sym}.")
+        return "\n".join(results)
     except Exception as e:
         return f"Error fetching quote for {symbol}: {str(e)}"
 
@@ -291,7 +1035,8 @@ async def get_stock_bars(
                 "1Day, 1Week, 1Month, etc."
             )
 
-        # Parse start/end times or calculate from days
+        # Parse start/end times or calculate from days, anchored on a single "now"
+        now = datetime.now()
         start_time: datetime | None = None
         end_time: datetime | None = None
 
@@ -322,16 +1067,27 @@ async def get_stock_bars(
                 # Calculate based on limit and timeframe for intraday data
                 if timeframe_obj.unit_value == TimeFrameUnit.Minute:
                     minutes_back = limit * timeframe_obj.amount
-                    start_time = datetime.now() - timedelta(minutes=minutes_back)
+                    start_time = now - timedelta(minutes=minutes_back)
                 elif timeframe_obj.unit_value == TimeFrameUnit.Hour:
                     hours_back = limit * timeframe_obj.amount
-                    start_time = datetime.now() - timedelta(hours=hours_back)
+                    start_time = now - timedelta(hours=hours_back)
             else:
                 # Fall back to days parameter for daily+ timeframes
-                start_time = datetime.now() - timedelta(days=days)
+                start_time = now - timedelta(days=days)
         if not end_time:
-            end_time = datetime.now()
-
+            end_time = now
+
+        # Windows derived from "now" are bucketed to the minute so repeated
+        # calls in an LLM tool loop share one response; explicit bounds are exact
+        cache_key = (
+            symbol,
+            timeframe_obj.amount_value,
+            timeframe_obj.unit_value,
+            start or now.replace(second=0, microsecond=0),
+            end or now.replace(second=0, microsecond=0),
+            limit,
+            days if not start else None,
+        )
         request_params = StockBarsRequest(
             symbol_or_symbols=symbol,
             timeframe=timeframe_obj,
@@ -339,8 +1095,12 @@ async def get_stock_bars(
             end=end_time,
             limit=limit,
         )
-
-        bars = stock_historical_data_client.get_stock_bars(request_params)
+        bars = await _bars_cache.get_or_fetch(
+            cache_key,
+            functools.partial(
+                stock_historical_data_client.get_stock_bars, request_params
+            ),
+        )
 
         if bars[symbol]:
             # Assert that start_time and end_time are not None
@@ -350,26 +1110,29 @@ async def get_stock_bars(
                 f"{start_time.strftime('%Y-%m-%d %H:%M')} to "
                 f"{end_time.strftime('%Y-%m-%d %H:%M')}"
             )
-            result = f"Historical Data for {symbol} ({timeframe} bars, {time_range}):\n"
-            result += "---------------------------------------------------\n"
+            parts = [
+                f"Historical Data for {symbol} ({timeframe} bars, {time_range}):\n",
+                _HISTORY_RULE,
+            ]
 
+            # Format timestamp based on timeframe unit
+            intraday = timeframe_obj.unit_value in (
+                TimeFrameUnit.Minute,
+                TimeFrameUnit.Hour,
+            )
             for bar in bars[symbol]:
-                # Format timestamp based on timeframe unit
-                if timeframe_obj.unit_value in [
-                    TimeFrameUnit.Minute,
-                    TimeFrameUnit.Hour,
-                ]:
+                if intraday:
                     time_str = bar.timestamp.strftime("%Y-%m-%d %H:%M:%S")
                 else:
-                    time_str = bar.timestamp.date()
+                    time_str = bar.timestamp.date().isoformat()
 
-                result += (
+                parts.append(
                     f"Time: {time_str}, Open: ${bar.open:.2f}, "
                     f"High: ${bar.high:.2f}, Low: ${bar.low:.2f}, "
                     f"Close: ${bar.close:.2f}, Volume: {bar.volume}\n"
                 )
 
-            return result
+            return "".join(parts)
         else:
             return (
                 f"No historical data found for {symbol} with {timeframe} "
@@ -406,13 +1169,14 @@ async def get_stock_trades(
     """
     try:
         # Calculate start time based on days
-        start_time = datetime.now() - timedelta(days=days)
+        now = datetime.now()
+        start_time = now - timedelta(days=days)
 
         # Create the request object with all available parameters
         request_params = StockTradesRequest(
             symbol_or_symbols=symbol,
             start=start_time,
-            end=datetime.now(),
+            end=now,
             limit=limit,
             sort=sort,
             feed=feed,
@@ -421,23 +1185,19 @@ async def get_stock_trades(
         )
 
         # Get the trades
-        trades = stock_historical_data_client.get_stock_trades(request_params)
+        trades = await _run(
+            stock_historical_data_client.get_stock_trades, request_params
+        )
 
         if symbol in trades:
-            result = f"Historical Trades for {symbol} (Last {days} days):\n"
-            result += "---------------------------------------------------\n"
+            parts = [
+                f"Historical Trades for {symbol} (Last {days} days):\n",
+                _HISTORY_RULE,
+            ]
 
             for trade in trades[symbol]:
-                result += f"""
-                    Time: {trade.timestamp}
-                    Price: ${float(trade.price):.6f}
-                    Size: {trade.size}
-                    Exchange: {trade.exchange}
-                    ID: {trade.id}
-                    Conditions: {trade.conditions}
-                    -------------------
-                    """
-            return result
+                parts.append(_TRADE_ROW_TMPL.format(trade=trade))
+            return "".join(parts)
         else:
             return f"No trade data found for {symbol} in the last {days} days."
     except Exception as e:
@@ -446,14 +1206,15 @@ async def get_stock_trades(
 
 @mcp.tool()
 async def get_stock_latest_trade(
-    symbol: str,
+    symbol: str | list[str],
     feed: DataFeed | None = None,
     currency: SupportedCurrencies | None = None,
 ) -> str:
-    """Get the latest trade for a stock.
+    """Get the latest trade for one or more stocks.
 
     Args:
-        symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
+        symbol: Stock ticker symbol or list of symbols (e.g., 'AAPL' or
+            ['AAPL', 'MSFT'])
         feed: The stock data feed to retrieve from (optional)
         currency: The currency for prices (optional, defaults to USD)
 
@@ -461,44 +1222,42 @@ async def get_stock_latest_trade(
         A formatted string containing the latest trade details or an error message
     """
     try:
-        # Create the request object with all available parameters
-        request_params = StockLatestTradeRequest(
-            symbol_or_symbols=symbol, feed=feed, currency=currency
-        )
-
-        # Get the latest trade
-        latest_trades = stock_historical_data_client.get_stock_latest_trade(
-            request_params
+        # Get the latest trades with all available parameters
+        latest_trades = await _fetch_latest_data(
+            symbol,
+            ("trade", feed, currency),
+            lambda symbols: stock_historical_data_client.get_stock_latest_trade(
+                StockLatestTradeRequest(
+                    symbol_or_symbols=symbols, feed=feed, currency=currency
+                )
+            ),
         )
 
-        if symbol in latest_trades:
-            trade = latest_trades[symbol]
-            return f"""
-                Latest Trade for {symbol}:
-                ---------------------------
-                Time: {trade.timestamp}
-                Price: ${float(trade.price):.6f}
-                Size: {trade.size}
-                Exchange: {trade.exchange}
-                ID: {trade.id}
-                Conditions: {trade.conditions}
-                """
-        else:
-            return f"No latest trade data found for {symbol}."
+        symbols = [symbol] if isinstance(symbol, str) else symbol
+        results = []
+        for sym in symbols:
+            if sym in latest_trades:
+                results.append(
+                    _LATEST_TRADE_TMPL.format(symbol=sym, trade=latest_trades[sym])
+                )
+            else:
+                results.append(f"No latest trade data found for {sym}.")
+        return "\n".join(results)
     except Exception as e:
         return f"Error fetching latest trade: {str(e)}"
 
 
 @mcp.tool()
 async def get_stock_latest_bar(
-    symbol: str,
+    symbol: str | list[str],
     feed: DataFeed | None = None,
     currency: SupportedCurrencies | None = None,
 ) -> str:
-    """Get the latest minute bar for a stock.
+    """Get the latest minute bar for one or more stocks.
 
     Args:
-        symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
+        symbol: Stock ticker symbol or list of symbols (e.g., 'AAPL' or
+            ['AAPL', 'MSFT'])
         feed: The stock data feed to retrieve from (optional)
         currency: The currency for prices (optional, defaults to USD)
 
@@ -506,32 +1265,82 @@ async def get_stock_latest_bar(
         A formatted string containing the latest bar details or an error message
     """
     try:
-        # Create the request object with all available parameters
-        request_params = StockLatestBarRequest(
-            symbol_or_symbols=symbol, feed=feed, currency=currency
+        # Get the latest bars with all available parameters
+        latest_bars = await _fetch_latest_data(
+            symbol,
+            ("bar", feed, currency),
+            lambda symbols: stock_historical_data_client.get_stock_latest_bar(
+                StockLatestBarRequest(
+                    symbol_or_symbols=symbols, feed=feed, currency=currency
+                )
+            ),
         )
 
-        # Get the latest bar
-        latest_bars = stock_historical_data_client.get_stock_latest_bar(request_params)
-
-        if symbol in latest_bars:
-            bar = latest_bars[symbol]
-            return f"""
-                Latest Minute Bar for {symbol}:
-                ---------------------------
-                Time: {bar.timestamp}
-                Open: ${float(bar.open):.2f}
-                High: ${float(bar.high):.2f}
-                Low: ${float(bar.low):.2f}
-                Close: ${float(bar.close):.2f}
-                Volume: {bar.volume}
-                """
-        else:
-            return f"No latest bar data found for {symbol}."
+        symbols = [symbol] if isinstance(symbol, str) else symbol
+        results = []
+        for sym in symbols:
+            if sym in latest_bars:
+                results.append(
+                    _LATEST_BAR_TMPL.format(symbol=sym, bar=latest_bars[sym])
+                )
+            else:
+                results.append(f"No latest bar data found for {sym}.")
+        return "\n".join(results)
     except Exception as e:
         return f"Error fetching latest bar: {str(e)}"
 
 
+@mcp.tool()
+async def get_stock_live_bars(
+    symbol: str, count: int = 1, timeout_seconds: float = 120.0
+) -> str:
+    """
+    Waits for the next live minute bars for a stock from the streaming data feed.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., AAPL, MSFT)
+        count (int): Number of bars to wait for (default: 1)
+        timeout_seconds (float): Maximum number of seconds to wait (default: 120)
+
+    Returns:
+        str: Formatted string containing the received bars or a timeout message
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        bars: list[Any] = []
+        async with _stock_bar_stream.subscribe(symbol) as queue:
+            while len(bars) < count:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    bar = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if isinstance(bar, Exception):
+                    raise bar
+                bars.append(bar)
+
+        if not bars:
+            return (
+                f"No live bars received for {symbol} within "
+                f"{timeout_seconds:g} seconds."
+            )
+
+        parts = [f"Live Minute Bars for {symbol}:\n", _HISTORY_RULE]
+        for bar in bars:
+            parts.append(
+                f"Time: {bar.timestamp.strftime('%Y-%m-%d %H:%M:%S')}, "
+                f"Open: ${bar.open:.2f}, High: ${bar.high:.2f}, "
+                f"Low: ${bar.low:.2f}, Close: ${bar.close:.2f}, "
+                f"Volume: {bar.volume}\n"
+            )
+        return "".join(parts)
+    except Exception as e:
+        return f"Error streaming bars for {symbol}: {str(e)}"
+
+
 # ============================================================================
 # Market Data Tools - Stock Snapshot Data with Helper Functions
 # ============================================================================
@@ -542,16 +1351,23 @@ def _format_ohlcv_bar(bar: Any, bar_type: str, include_time: bool = True) -> str
     if not bar:
         return ""
 
-    time_format = "%Y-%m-%d %H:%M:%S %Z" if include_time else "%Y-%m-%d"
-    time_label = "Timestamp" if include_time else "Date"
-
-    return f"""{bar_type}:
-  Open: ${bar.open:.2f}, High: ${bar.high:.2f}, Low: ${bar.low:.2f},
-  Close: ${bar.close:.2f}
-  Volume: {bar.volume:,},
-  {time_label}: {bar.timestamp.strftime(time_format)}
+    if include_time:
+        time_label = "Timestamp"
+        time_str = bar.timestamp.isoformat(sep=" ", timespec="seconds")
+    else:
+        time_label = "Date"
+        time_str = bar.timestamp.date().isoformat()
 
-"""
+    return _OHLCV_BAR_TMPL.format(
+        bar_type=bar_type,
+        open=bar.open,
+        high=bar.high,
+        low=bar.low,
+        close=bar.close,
+        volume=bar.volume,
+        time_label=time_label,
+        time_str=time_str,
+    )
 
 
 def _format_quote_data(quote: Any) -> str:
@@ -562,7 +1378,7 @@ def _format_quote_data(quote: Any) -> str:
     return f"""Latest Quote:
   Bid: ${quote.bid_price:.2f} x {quote.bid_size},
   Ask: ${quote.ask_price:.2f} x {quote.ask_size}
-  Timestamp: {quote.timestamp.strftime('%Y-%m-%d %H:%M:%S %Z')}
+  Timestamp: {quote.timestamp.isoformat(sep=" ", timespec="seconds")}
 
 """
 
@@ -572,23 +1388,56 @@ def _format_trade_data(trade: Any) -> str:
     if not trade:
         return ""
 
+    # Trade models always define these fields; only empty values are skipped
     optional_fields = []
-    if hasattr(trade, "exchange") and trade.exchange:
+    if trade.exchange:
         optional_fields.append(f"Exchange: {trade.exchange}")
-    if hasattr(trade, "conditions") and trade.conditions:
+    if trade.conditions:
         optional_fields.append(f"Conditions: {trade.conditions}")
-    if hasattr(trade, "id") and trade.id:
+    if trade.id:
         optional_fields.append(f"ID: {trade.id}")
 
     optional_str = f", {', '.join(optional_fields)}" if optional_fields else ""
 
     return f"""Latest Trade:
   Price: ${trade.price:.2f}, Size: {trade.size}{optional_str}
-  Timestamp: {trade.timestamp.strftime('%Y-%m-%d %H:%M:%S %Z')}
+  Timestamp: {trade.timestamp.isoformat(sep=" ", timespec="seconds")}
 
 """
 
 
+def _render_stock_snapshots(
+    symbols: list[str], snapshots: dict[str, Any]
+) -> Iterator[str]:
+    """Yield the non-empty sections of a stock snapshot response.
+
+    Symbols present in ``snapshots`` are rendered straight from the response;
+    any of ``symbols`` missing from it get a "No data available" line after.
+    """
+    yield "Stock Snapshots:"
+    yield "=" * 15
+    yield ""
+
+    for symbol, snapshot in snapshots.items():
+        # Build snapshot data using helper functions
+        yield f"Symbol: {symbol}"
+        yield "-" * 15
+        for section in (
+            _format_quote_data(snapshot.latest_quote),
+            _format_trade_data(snapshot.latest_trade),
+            _format_ohlcv_bar(snapshot.minute_bar, "Latest Minute Bar", True),
+            _format_ohlcv_bar(snapshot.daily_bar, "Latest Daily Bar", False),
+            _format_ohlcv_bar(snapshot.previous_daily_bar, "Previous Daily Bar", False),
+        ):
+            if section:  # Skip empty sections
+                yield section
+
+    # Requested symbols the API returned nothing for, in request order
+    for symbol in symbols:
+        if symbol not in snapshots:
+            yield f"No data available for {symbol}\n"
+
+
 @mcp.tool()
 async def get_stock_snapshot(
     symbol_or_symbols: str | list[str],
@@ -618,7 +1467,7 @@ async def get_stock_snapshot(
         request = StockSnapshotRequest(
             symbol_or_symbols=symbol_or_symbols, feed=feed, currency=currency
         )
-        snapshots = stock_historical_data_client.get_stock_snapshot(request)
+        snapshots = await _run(stock_historical_data_client.get_stock_snapshot, request)
 
         # Format response
         symbols = (
@@ -626,37 +1475,12 @@ async def get_stock_snapshot(
             if isinstance(symbol_or_symbols, str)
             else symbol_or_symbols
         )
-        results = ["Stock Snapshots:", "=" * 15, ""]
-
-        for symbol in symbols:
-            snapshot = snapshots.get(symbol)
-            if not snapshot:
-                results.append(f"No data available for {symbol}\n")
-                continue
-
-            # Build snapshot data using helper functions
-            snapshot_data = [
-                f"Symbol: {symbol}",
-                "-" * 15,
-                _format_quote_data(snapshot.latest_quote),
-                _format_trade_data(snapshot.latest_trade),
-                _format_ohlcv_bar(snapshot.minute_bar, "Latest Minute Bar", True),
-                _format_ohlcv_bar(snapshot.daily_bar, "Latest Daily Bar", False),
-                _format_ohlcv_bar(
-                    snapshot.previous_daily_bar, "Previous Daily Bar", False
-                ),
-            ]
-
-            results.extend(filter(None, snapshot_data))  # Filter out empty strings
-
-        return "\n".join(results)
+        return "\n".join(_render_stock_snapshots(symbols, snapshots))
 
     except APIError as api_error:
         error_message = str(api_error)
         # Handle specific data feed subscription errors
-        if "subscription" in error_message.lower() and (
-            "sip" in error_message.lower() or "premium" in error_message.lower()
-        ):
+        if _SUB_ERR_RE.search(error_message):
             return f"""
                     Error: Premium data feed subscription required.
 
@@ -685,7 +1509,15 @@ async def get_stock_snapshot(
 # ============================================================================
 
 
+# Request models are validated on construction and never mutated by the SDK,
+# so polling tools reuse one instance per distinct set of arguments
+@functools.lru_cache(maxsize=128)
+def _orders_request(status: QueryOrderStatus, limit: int) -> GetOrdersRequest:
+    return GetOrdersRequest(status=status, limit=limit)
+
+
 @mcp.tool()
+@_tool_safe("fetching orders")
 async def get_orders(status: str = "all", limit: int = 10) -> str:
     """
     Retrieves and formats orders with the specified status.
@@ -705,49 +1537,80 @@ async def get_orders(status: str = "all", limit: int = 10) -> str:
             - Submission Time
             - Fill Details (if applicable)
     """
-    try:
-        # Convert status string to enum
-        if status.lower() == "open":
-            query_status = QueryOrderStatus.OPEN
-        elif status.lower() == "closed":
-            query_status = QueryOrderStatus.CLOSED
-        else:
-            query_status = QueryOrderStatus.ALL
-
-        request_params = GetOrdersRequest(status=query_status, limit=limit)
-
-        orders = trade_client.get_orders(request_params)
-
-        if not orders:
-            return f"No {status} orders found."
-
-        result = f"{status.capitalize()} Orders (Last {len(orders)}):\n"
-        result += "-----------------------------------\n"
-
-        for order in orders:
-            result += f"""
-                        Symbol: {order.symbol}
-                        ID: {order.id}
-                        Type: {order.type}
-                        Side: {order.side}
-                        Quantity: {order.qty}
-                        Status: {order.status}
-                        Submitted At: {order.submitted_at}
-                        """
-            if hasattr(order, "filled_at") and order.filled_at:
-                result += f"Filled At: {order.filled_at}\n"
-
-            if hasattr(order, "filled_avg_price") and order.filled_avg_price:
-                result += f"Filled Price: ${float(order.filled_avg_price):.2f}\n"
-
-            result += "-----------------------------------\n"
-
-        return result
-    except Exception as e:
-        return f"Error fetching orders: {str(e)}"
+    # Convert status string to enum, anything unrecognised means all
+    query_status = _QUERY_STATUS_MAP.get(status) or _QUERY_STATUS_MAP.get(
+        status.lower(), QueryOrderStatus.ALL
+    )
+
+    request_params = _orders_request(query_status, limit)
+
+    orders = await _run(trade_client.get_orders, request_params)
+
+    if not orders:
+        return f"No {status} orders found."
+
+    parts = [
+        f"{status.capitalize()} Orders (Last {len(orders)}):\n",
+        "-----------------------------------\n",
+    ]
+    for order in orders:
+        parts.append(_ORDER_ROW_TMPL.format_map(vars(order)))
+        filled_at = getattr(order, "filled_at", None)
+        if filled_at:
+            parts.append(f"Filled At: {filled_at}\n")
+
+        # The SDK model types this as str | float, hence the float()
+        filled_avg_price = getattr(order, "filled_avg_price", None)
+        if filled_avg_price:
+            parts.append(f"Filled Price: ${float(filled_avg_price):.2f}\n")
+
+        parts.append("-----------------------------------\n")
+
+    return "".join(parts)
+
+
+# Order type -> (request class, OrderType, price arguments it takes, whether
+# all or any of them must be set, error message when that check fails)
+_ORDER_SPEC: dict[
+    str,
+    tuple[type[OrderRequest], OrderType, tuple[str, ...], Callable[[Any], bool], str],
+] = {
+    "MARKET": (MarketOrderRequest, OrderType.MARKET, (), all, ""),
+    "LIMIT": (
+        LimitOrderRequest,
+        OrderType.LIMIT,
+        ("limit_price",),
+        all,
+        "limit_price is required for LIMIT orders.",
+    ),
+    "STOP": (
+        StopOrderRequest,
+        OrderType.STOP,
+        ("stop_price",),
+        all,
+        "stop_price is required for STOP orders.",
+    ),
+    "STOP_LIMIT": (
+        StopLimitOrderRequest,
+        OrderType.STOP_LIMIT,
+        ("stop_price", "limit_price"),
+        all,
+        "Both stop_price and limit_price are required for STOP_LIMIT orders.",
+    ),
+    "TRAILING_STOP": (
+        TrailingStopOrderRequest,
+        OrderType.TRAILING_STOP,
+        ("trail_price", "trail_percent"),
+        any,
+        "Either trail_price or trail_percent is required for TRAILING_STOP orders.",
+    ),
+}
+# The tool's own default is "market", so accept lower-case keys directly too
+_ORDER_SPEC |= {name.lower(): spec for name, spec in _ORDER_SPEC.items()}
 
 
 @mcp.tool()
+@_tool_safe("placing order")
 async def place_stock_order(
     symbol: str,
     side: str,
@@ -782,127 +1645,56 @@ async def place_stock_order(
     Returns:
         str: Formatted string containing order details or error message.
     """
-    try:
-        # Validate side
-        if side.lower() == "buy":
-            order_side = OrderSide.BUY
-        elif side.lower() == "sell":
-            order_side = OrderSide.SELL
-        else:
-            return f"Invalid order side: {side}. Must be 'buy' or 'sell'."
-
-        # Validate and convert time_in_force to enum
-        tif_enum = None
-        if isinstance(time_in_force, TimeInForce):
-            tif_enum = time_in_force
-        elif isinstance(time_in_force, str):
-            # Convert string to TimeInForce enum
-            time_in_force_upper = time_in_force.upper()
-            if time_in_force_upper == "DAY":
-                tif_enum = TimeInForce.DAY
-            elif time_in_force_upper == "GTC":
-                tif_enum = TimeInForce.GTC
-            elif time_in_force_upper == "OPG":
-                tif_enum = TimeInForce.OPG
-            elif time_in_force_upper == "CLS":
-                tif_enum = TimeInForce.CLS
-            elif time_in_force_upper == "IOC":
-                tif_enum = TimeInForce.IOC
-            elif time_in_force_upper == "FOK":
-                tif_enum = TimeInForce.FOK
-            else:
-                return f"Invalid time_in_force: {time_in_force}. Valid options are: DAY, GTC, OPG, CLS, IOC, FOK"
-        else:
-            return f"Invalid time_in_force type: {type(time_in_force)}. Must be string or TimeInForce enum."
-
-        # Validate order_type
-        order_type_upper = order_type.upper()
-        if order_type_upper == "MARKET":
-            order_data = MarketOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
-                type=OrderType.MARKET,
-                time_in_force=tif_enum,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}",
-            )
-        elif order_type_upper == "LIMIT":
-            if limit_price is None:
-                return "limit_price is required for LIMIT orders."
-            order_data = LimitOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
-                type=OrderType.LIMIT,
-                time_in_force=tif_enum,
-                limit_price=limit_price,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}",
-            )
-        elif order_type_upper == "STOP":
-            if stop_price is None:
-                return "stop_price is required for STOP orders."
-            order_data = StopOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
-                type=OrderType.STOP,
-                time_in_force=tif_enum,
-                stop_price=stop_price,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}",
-            )
-        elif order_type_upper == "STOP_LIMIT":
-            if stop_price is None or limit_price is None:
-                return "Both stop_price and limit_price are required for STOP_LIMIT orders."
-            order_data = StopLimitOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
-                type=OrderType.STOP_LIMIT,
-                time_in_force=tif_enum,
-                stop_price=stop_price,
-                limit_price=limit_price,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}",
-            )
-        elif order_type_upper == "TRAILING_STOP":
-            if trail_price is None and trail_percent is None:
-                return "Either trail_price or trail_percent is required for TRAILING_STOP orders."
-            order_data = TrailingStopOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
-                type=OrderType.TRAILING_STOP,
-                time_in_force=tif_enum,
-                trail_price=trail_price,
-                trail_percent=trail_percent,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}",
-            )
-        else:
-            return f"Invalid order type: {order_type}. Must be one of: MARKET, LIMIT, STOP, STOP_LIMIT, TRAILING_STOP."
-
-        # Submit order
-        order = trade_client.submit_order(order_data)
-        return f"""
-Order Placed Successfully:
--------------------------
-Order ID: {order.id}
-Symbol: {order.symbol}
-Side: {order.side}
-Quantity: {order.qty}
-Type: {order.type}
-Time In Force: {order.time_in_force}
-Status: {order.status}
-Client Order ID: {order.client_order_id}
-"""
-    except Exception as e:
-        return f"Error placing order: {str(e)}"
+    # Validate side
+    order_side = _SIDE_MAP.get(side) or _SIDE_MAP.get(side.lower())
+    if order_side is None:
+        return f"Invalid order side: {side}. Must be 'buy' or 'sell'."
+
+    # Validate and convert time_in_force to enum
+    if isinstance(time_in_force, TimeInForce):
+        tif_enum: TimeInForce = time_in_force
+    elif isinstance(time_in_force, str):
+        tif = _TIF_MAP.get(time_in_force) or _TIF_MAP.get(time_in_force.upper())
+        if tif is None:
+            return f"Invalid time_in_force: {time_in_force}. Valid options are: DAY, GTC, OPG, CLS, IOC, FOK"
+        tif_enum = tif
+    else:
+        return f"Invalid time_in_force type: {type(time_in_force)}. Must be string or TimeInForce enum."
+
+    # Validate order_type
+    spec = _ORDER_SPEC.get(order_type) or _ORDER_SPEC.get(order_type.upper())
+    if spec is None:
+        return f"Invalid order type: {order_type}. Must be one of: MARKET, LIMIT, STOP, STOP_LIMIT, TRAILING_STOP."
+
+    request_cls, order_type_enum, price_fields, check, missing_message = spec
+    prices: dict[str, Any] = {
+        "limit_price": limit_price,
+        "stop_price": stop_price,
+        "trail_price": trail_price,
+        "trail_percent": trail_percent,
+    }
+    if not check(prices[field] is not None for field in price_fields):
+        return missing_message
+
+    order_data = request_cls(
+        symbol=symbol,
+        qty=quantity,
+        side=order_side,
+        type=order_type_enum,
+        time_in_force=tif_enum,
+        extended_hours=extended_hours,
+        client_order_id=client_order_id or f"order_{time.time_ns()}",
+        **{field: prices[field] for field in price_fields},
+    )
+
+    # Submit order
+    order = await _run(trade_client.submit_order, order_data)
+    _account_cache.clear()
+    return _ORDER_PLACED_TMPL.format(order=order)
 
 
 @mcp.tool()
+@_tool_safe("cancelling orders")
 async def cancel_all_orders() -> str:
     """
     Cancel all open orders.
@@ -910,32 +1702,27 @@ async def cancel_all_orders() -> str:
     Returns:
         A formatted string containing the status of each cancelled order.
     """
-    try:
-        # Cancel all orders
-        cancel_responses = trade_client.cancel_orders()
-
-        if not cancel_responses:
-            return "No orders were found to cancel."
-
-        # Format the response
-        response_parts = ["Order Cancellation Results:"]
-        response_parts.append("-" * 30)
+    # Cancel all orders. DELETE /v2/orders cancels every order server-side in
+    # one round trip, so fanning out cancel_order_by_id calls would be slower
+    cancel_responses = await _run(trade_client.cancel_orders)
 
-        for response in cancel_responses:
-            status = "Success" if response.status == 200 else "Failed"
-            response_parts.append(f"Order ID: {response.id}")
-            response_parts.append(f"Status: {status}")
-            if response.body:
-                response_parts.append(f"Details: {response.body}")
-            response_parts.append("-" * 30)
+    if not cancel_responses:
+        return "No orders were found to cancel."
 
-        return "\n".join(response_parts)
+    # Format the response, one block per cancelled order
+    blocks = []
+    for response in cancel_responses:
+        status = "Success" if response.status == 200 else "Failed"
+        details = f"Details: {response.body}\n" if response.body else ""
+        blocks.append(
+            f"Order ID: {response.id}\nStatus: {status}\n{details}{_RESULT_RULE}"
+        )
 
-    except Exception as e:
-        return f"Error cancelling orders: {str(e)}"
+    return "\n".join(["Order Cancellation Results:", _RESULT_RULE, *blocks])
 
 
 @mcp.tool()
+@_tool_safe("cancelling order {order_id}")
 async def cancel_order_by_id(order_id: str) -> str:
     """
     Cancel a specific order by its ID.
@@ -946,26 +1733,17 @@ async def cancel_order_by_id(order_id: str) -> str:
     Returns:
         A formatted string containing the status of the cancelled order.
     """
-    try:
-        # Cancel the specific order
-        response = trade_client.cancel_order_by_id(order_id)
+    # Cancel the specific order
+    response = await _run(trade_client.cancel_order_by_id, order_id)
 
-        # Format the response
-        status = "Success" if response.status == 200 else "Failed"
-        result = f"""
-        Order Cancellation Result:
-        ------------------------
-        Order ID: {response.id}
-        Status: {status}
-        """
-
-        if response.body:
-            result += f"Details: {response.body}\n"
+    # Format the response
+    status = "Success" if response.status == 200 else "Failed"
+    result = _ORDER_CANCEL_TMPL.format(response=response, status=status)
 
-        return result
+    if response.body:
+        result += f"Details: {response.body}\n"
 
-    except Exception as e:
-        return f"Error cancelling order {order_id}: {str(e)}"
+    return result
 
 
 # ============================================================================
@@ -974,6 +1752,7 @@ async def cancel_order_by_id(order_id: str) -> str:
 
 
 @mcp.tool()
+@_tool_safe("closing position")
 async def close_position(
     symbol: str, qty: str | None = None, percentage: str | None = None
 ) -> str:
@@ -988,23 +1767,14 @@ async def close_position(
     Returns:
         str: Formatted string containing position closure details or error message
     """
-    try:
-        # Create close position request if options are provided
-        close_options = None
-        if qty or percentage:
-            close_options = ClosePositionRequest(qty=qty, percentage=percentage)
-
-        # Close the position
-        order = trade_client.close_position(symbol, close_options)
-
-        return f"""
-                Position Closed Successfully:
-                ----------------------------
-                Symbol: {symbol}
-                Order ID: {order.id}
-                Status: {order.status}
-                """
+    # Create close position request if options are provided
+    close_options = None
+    if qty or percentage:
+        close_options = ClosePositionRequest(qty=qty, percentage=percentage)
 
+    # Close the position
+    try:
+        order = await _run(trade_client.close_position, symbol, close_options)
     except APIError as api_error:
         error_message = str(api_error)
         if (
@@ -1020,14 +1790,14 @@ async def close_position(
             2. Close the entire position (100%)
             3. Specify an exact quantity using the qty parameter
             """
-        else:
-            return f"Error closing position: {error_message}"
+        raise
+    _account_cache.clear()
 
-    except Exception as e:
-        return f"Error closing position: {str(e)}"
+    return _POSITION_CLOSED_TMPL.format(symbol=symbol, order=order)
 
 
 @mcp.tool()
+@_tool_safe("closing positions")
 async def close_all_positions(cancel_orders: bool = False) -> str:
     """
     Closes all open positions.
@@ -1038,28 +1808,26 @@ async def close_all_positions(cancel_orders: bool = False) -> str:
     Returns:
         str: Formatted string containing position closure results
     """
-    try:
-        # Close all positions
-        close_responses = trade_client.close_all_positions(cancel_orders=cancel_orders)
-
-        if not close_responses:
-            return "No positions were found to close."
-
-        # Format the response
-        response_parts = ["Position Closure Results:"]
-        response_parts.append("-" * 30)
-
-        for response in close_responses:
-            response_parts.append(f"Symbol: {response.symbol}")
-            response_parts.append(f"Status: {response.status}")
-            if response.order_id:
-                response_parts.append(f"Order ID: {response.order_id}")
-            response_parts.append("-" * 30)
-
-        return "\n".join(response_parts)
+    # Close all positions. Like cancel_all_orders this is a single batch
+    # request (DELETE /v2/positions), already bounded by one round trip
+    close_responses = await _run(
+        trade_client.close_all_positions, cancel_orders=cancel_orders
+    )
+    _account_cache.clear()
+
+    if not close_responses:
+        return "No positions were found to close."
+
+    # Format the response, one block per closed position
+    blocks = []
+    for response in close_responses:
+        order_id = f"Order ID: {response.order_id}\n" if response.order_id else ""
+        blocks.append(
+            f"Symbol: {response.symbol}\nStatus: {response.status}\n"
+            f"{order_id}{_RESULT_RULE}"
+        )
 
-    except Exception as e:
-        return f"Error closing positions: {str(e)}"
+    return "\n".join(["Position Closure Results:", _RESULT_RULE, *blocks])
 
 
 # ============================================================================
@@ -1068,6 +1836,7 @@ async def close_all_positions(cancel_orders: bool = False) -> str:
 
 
 @mcp.tool()
+@_tool_safe("fetching asset information")
 async def get_asset_info(symbol: str) -> str:
     """
     Retrieves and formats detailed information about a specific asset.
@@ -1083,26 +1852,37 @@ async def get_asset_info(symbol: str) -> str:
             - Status
             - Trading Properties
     """
-    try:
-        asset = trade_client.get_asset(symbol)
-        return f"""
-                Asset Information for {symbol}:
-                ----------------------------
-                Name: {asset.name}
-                Exchange: {asset.exchange}
-                Class: {asset.asset_class}
-                Status: {asset.status}
-                Tradable: {'Yes' if asset.tradable else 'No'}
-                Marginable: {'Yes' if asset.marginable else 'No'}
-                Shortable: {'Yes' if asset.shortable else 'No'}
-                Easy to Borrow: {'Yes' if asset.easy_to_borrow else 'No'}
-                Fractionable: {'Yes' if asset.fractionable else 'No'}
-                """
-    except Exception as e:
-        return f"Error fetching asset information: {str(e)}"
+    asset = await _asset_cache.get_or_fetch(
+        symbol.upper(), functools.partial(trade_client.get_asset, symbol)
+    )
+    return _ASSET_INFO_TMPL.format(
+        symbol=symbol,
+        asset=asset,
+        tradable="Yes" if asset.tradable else "No",
+        marginable="Yes" if asset.marginable else "No",
+        shortable="Yes" if asset.shortable else "No",
+        easy_to_borrow="Yes" if asset.easy_to_borrow else "No",
+        fractionable="Yes" if asset.fractionable else "No",
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _assets_request(
+    status: str | None,
+    asset_class: str | None,
+    exchange: str | None,
+    attributes: str | None,
+) -> GetAssetsRequest:
+    return GetAssetsRequest(
+        status=status,
+        asset_class=asset_class,
+        exchange=exchange,
+        attributes=attributes,
+    )
 
 
 @mcp.tool()
+@_tool_safe("fetching assets")
 async def get_all_assets(
     status: str | None = None,
     asset_class: str | None = None,
@@ -1118,40 +1898,30 @@ async def get_all_assets(
         exchange: Filter by exchange (e.g., 'NYSE', 'NASDAQ')
         attributes: Comma-separated values to query for multiple attributes
     """
-    try:
-        # Create filter if any parameters are provided
-        filter_params = None
-        if any([status, asset_class, exchange, attributes]):
-            filter_params = GetAssetsRequest(
-                status=status,
-                asset_class=asset_class,
-                exchange=exchange,
-                attributes=attributes,
+    # Create filter if any parameters are provided
+    filter_params = None
+    if any([status, asset_class, exchange, attributes]):
+        filter_params = _assets_request(status, asset_class, exchange, attributes)
+
+    # Get all assets
+    assets = await _run(trade_client.get_all_assets, filter_params)
+
+    if not assets:
+        return "No assets found matching the criteria."
+
+    # Format the response. An unfiltered call returns ~30k assets, so
+    # rows go straight into one buffer rather than a list of strings
+    buf = io.StringIO()
+    buf.write("Available Assets:\n" + "-" * 30)
+    for asset in assets:
+        buf.write("\n")
+        buf.write(
+            _ASSET_ROW_TMPL.format(
+                asset=asset, tradable="Yes" if asset.tradable else "No"
             )
+        )
 
-        # Get all assets
-        assets = trade_client.get_all_assets(filter_params)
-
-        if not assets:
-            return "No assets found matching the criteria."
-
-        # Format the response
-        response_parts = ["Available Assets:"]
-        response_parts.append("-" * 30)
-
-        for asset in assets:
-            response_parts.append(f"Symbol: {asset.symbol}")
-            response_parts.append(f"Name: {asset.name}")
-            response_parts.append(f"Exchange: {asset.exchange}")
-            response_parts.append(f"Class: {asset.asset_class}")
-            response_parts.append(f"Status: {asset.status}")
-            response_parts.append(f"Tradable: {'Yes' if asset.tradable else 'No'}")
-            response_parts.append("-" * 30)
-
-        return "\n".join(response_parts)
-
-    except Exception as e:
-        return f"Error fetching assets: {str(e)}"
+    return buf.getvalue()
 
 
 # ============================================================================
@@ -1160,6 +1930,7 @@ async def get_all_assets(
 
 
 @mcp.tool()
+@_tool_safe("creating watchlist")
 async def create_watchlist(name: str, symbols: list[str]) -> str:
     """
     Creates a new watchlist with specified symbols.
@@ -1171,43 +1942,40 @@ async def create_watchlist(name: str, symbols: list[str]) -> str:
     Returns:
         str: Confirmation message with watchlist creation status
     """
-    try:
-        watchlist_data = CreateWatchlistRequest(name=name, symbols=symbols)
-        trade_client.create_watchlist(watchlist_data)
-        return f"Watchlist '{name}' created successfully with {len(symbols)} symbols."
-    except Exception as e:
-        return f"Error creating watchlist: {str(e)}"
+    watchlist_data = CreateWatchlistRequest(name=name, symbols=symbols)
+    await _run(trade_client.create_watchlist, watchlist_data)
+    return f"Watchlist '{name}' created successfully with {len(symbols)} symbols."
 
 
 @mcp.tool()
+@_tool_safe("fetching watchlists")
 async def get_watchlists() -> str:
     """Get all watchlists for the account."""
-    try:
-        watchlists = trade_client.get_watchlists()
-        result = "Watchlists:\n------------\n"
-        for wl in watchlists:
-            result += f"Name: {wl.name}\n"
-            result += f"ID: {wl.id}\n"
-            result += f"Created: {wl.created_at}\n"
-            result += f"Updated: {wl.updated_at}\n"
-            # Use wl.symbols, fallback to empty list if missing
-            result += f"Symbols: {', '.join(getattr(wl, 'symbols', []) or [])}\n\n"
-        return result
-    except Exception as e:
-        return f"Error fetching watchlists: {str(e)}"
+    watchlists = await _run(trade_client.get_watchlists)
+    parts = ["Watchlists:\n------------\n"]
+    for wl in watchlists:
+        # Use wl.symbols, fallback to empty list if missing
+        parts.append(
+            f"Name: {wl.name}\n"
+            f"ID: {wl.id}\n"
+            f"Created: {wl.created_at}\n"
+            f"Updated: {wl.updated_at}\n"
+            f"Symbols: {', '.join(getattr(wl, 'symbols', []) or [])}\n\n"
+        )
+    return "".join(parts)
 
 
 @mcp.tool()
+@_tool_safe("updating watchlist")
 async def update_watchlist(
     watchlist_id: str, name: str | None = None, symbols: list[str] | None = None
 ) -> str:
     """Update an existing watchlist."""
-    try:
-        update_request = UpdateWatchlistRequest(name=name, symbols=symbols)
-        watchlist = trade_client.update_watchlist_by_id(watchlist_id, update_request)
-        return f"Watchlist updated successfully: {watchlist.name}"
-    except Exception as e:
-        return f"Error updating watchlist: {str(e)}"
+    update_request = UpdateWatchlistRequest(name=name, symbols=symbols)
+    watchlist = await _run(
+        trade_client.update_watchlist_by_id, watchlist_id, update_request
+    )
+    return f"Watchlist updated successfully: {watchlist.name}"
 
 
 # ============================================================================
@@ -1216,6 +1984,7 @@ async def update_watchlist(
 
 
 @mcp.tool()
+@_tool_safe("fetching market clock")
 async def get_market_clock() -> str:
     """
     Retrieves and formats current market status and next open/close times.
@@ -1227,21 +1996,14 @@ async def get_market_clock() -> str:
             - Next Open Time
             - Next Close Time
     """
-    try:
-        clock = trade_client.get_clock()
-        return f"""
-                Market Status:
-                -------------
-                Current Time: {clock.timestamp}
-                Is Open: {'Yes' if clock.is_open else 'No'}
-                Next Open: {clock.next_open}
-                Next Close: {clock.next_close}
-                """
-    except Exception as e:
-        return f"Error fetching market clock: {str(e)}"
+    clock = await _clock_cache.get_or_fetch((), trade_client.get_clock)
+    return _MARKET_CLOCK_TMPL.format(
+        clock=clock, is_open="Yes" if clock.is_open else "No"
+    )
 
 
 @mcp.tool()
+@_tool_safe("fetching market calendar")
 async def get_market_calendar(start_date: str, end_date: str) -> str:
     """
     Retrieves and formats market calendar for specified date range.
@@ -1253,14 +2015,25 @@ async def get_market_calendar(start_date: str, end_date: str) -> str:
     Returns:
         str: Formatted string containing market calendar information
     """
+    # date.fromisoformat is implemented in C; the SDK takes the dates through
+    # a GetCalendarRequest filter rather than as keyword arguments
     try:
-        calendar = trade_client.get_calendar(start=start_date, end=end_date)
-        result = f"Market Calendar ({start_date} to {end_date}):\n----------------------------\n"
-        for day in calendar:
-            result += f"Date: {day.date}, Open: {day.open}, Close: {day.close}\n"
-        return result
-    except Exception as e:
-        return f"Error fetching market calendar: {str(e)}"
+        filters = GetCalendarRequest(
+            start=date.fromisoformat(start_date), end=date.fromisoformat(end_date)
+        )
+    except ValueError:
+        return (
+            f"Invalid date range: {start_date} to {end_date}. "
+            "Dates must be in YYYY-MM-DD format."
+        )
+
+    calendar = await _run(trade_client.get_calendar, filters)
+    parts = [
+        f"Market Calendar ({start_date} to {end_date}):\n----------------------------\n"
+    ]
+    for day in calendar:
+        parts.append(f"Date: {day.date}, Open: {day.open}, Close: {day.close}\n")
+    return "".join(parts)
 
 
 # ============================================================================
@@ -1268,7 +2041,27 @@ async def get_market_calendar(start_date: str, end_date: str) -> str:
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
+def _announcements_request(
+    ca_types: tuple[CorporateActionType, ...],
+    since: date,
+    until: date,
+    symbol: str | None,
+    cusip: str | None,
+    date_type: CorporateActionDateType | None,
+) -> GetCorporateAnnouncementsRequest:
+    return GetCorporateAnnouncementsRequest(
+        ca_types=list(ca_types),
+        since=since,
+        until=until,
+        symbol=symbol,
+        cusip=cusip,
+        date_type=date_type,
+    )
+
+
 @mcp.tool()
+@_tool_safe("fetching corporate announcements")
 async def get_corporate_announcements(
     ca_types: list[CorporateActionType],
     since: date,
@@ -1291,37 +2084,14 @@ async def get_corporate_announcements(
     Returns:
         str: Formatted string containing corporate announcement details
     """
-    try:
-        request = GetCorporateAnnouncementsRequest(
-            ca_types=ca_types,
-            since=since,
-            until=until,
-            symbol=symbol,
-            cusip=cusip,
-            date_type=date_type,
-        )
-        announcements = trade_client.get_corporate_announcements(request)
-        result = "Corporate Announcements:\n----------------------\n"
-        for ann in announcements:
-            result += f"""
-                        ID: {ann.id}
-                        Corporate Action ID: {ann.corporate_action_id}
-                        Type: {ann.ca_type}
-                        Sub Type: {ann.ca_sub_type}
-                        Initiating Symbol: {ann.initiating_symbol}
-                        Target Symbol: {ann.target_symbol}
-                        Declaration Date: {ann.declaration_date}
-                        Ex Date: {ann.ex_date}
-                        Record Date: {ann.record_date}
-                        Payable Date: {ann.payable_date}
-                        Cash: {ann.cash}
-                        Old Rate: {ann.old_rate}
-                        New Rate: {ann.new_rate}
-                        ----------------------
-                        """
-        return result
-    except Exception as e:
-        return f"Error fetching corporate announcements: {str(e)}"
+    request = _announcements_request(
+        tuple(ca_types), since, until, symbol, cusip, date_type
+    )
+    announcements = await _run(trade_client.get_corporate_announcements, request)
+    parts = ["Corporate Announcements:\n----------------------\n"]
+    for ann in announcements:
+        parts.append(_ANNOUNCEMENT_ROW_TMPL.format_map(vars(ann)))
+    return "".join(parts)
 
 
 # ============================================================================
@@ -1382,49 +2152,58 @@ async def get_option_contracts(
             limit=limit,
         )
 
-        # Get the option contracts
-        response = trade_client.get_option_contracts(request)
+        # Get the option contracts, keyed on every filter argument
+        response = await _option_contracts_cache.get_or_fetch(
+            (
+                underlying_symbol,
+                expiration_date,
+                strike_price_gte,
+                strike_price_lte,
+                type,
+                status,
+                root_symbol,
+                limit,
+            ),
+            functools.partial(trade_client.get_option_contracts, request),
+        )
 
         if not response or not response.option_contracts:
             return f"No option contracts found for {underlying_symbol} matching the criteria."
 
         # Format the response
-        result = f"Option Contracts for {underlying_symbol}:\n"
-        result += "----------------------------------------\n"
-
+        parts = [
+            f"Option Contracts for {underlying_symbol}:\n",
+            "----------------------------------------\n",
+        ]
         for contract in response.option_contracts:
-            result += f"""
-                Symbol: {contract.symbol}
-                Name: {contract.name}
-                Type: {contract.type}
-                Strike Price: ${float(contract.strike_price):.2f}
-                Expiration Date: {contract.expiration_date}
-                Status: {contract.status}
-                Root Symbol: {contract.root_symbol}
-                Underlying Symbol: {contract.underlying_symbol}
-                Exercise Style: {contract.style}
-                Contract Size: {contract.size}
-                Tradable: {'Yes' if contract.tradable else 'No'}
-                Open Interest: {contract.open_interest}
-                Close Price: ${float(contract.close_price) if contract.close_price else 'N/A'}
-                Close Price Date: {contract.close_price_date}
-                -------------------------
-                """
-
-        return result
+            parts.append(
+                _OPTION_CONTRACT_TMPL.format(
+                    contract=contract,
+                    tradable="Yes" if contract.tradable else "No",
+                    close_price=(
+                        float(contract.close_price) if contract.close_price else "N/A"
+                    ),
+                )
+            )
+
+        return "".join(parts)
 
     except Exception as e:
         return f"Error fetching option contracts: {str(e)}"
 
 
 @mcp.tool()
-async def get_option_latest_quote(symbol: str, feed: OptionsFeed | None = None) -> str:
+async def get_option_latest_quote(
+    symbol: str | list[str], feed: OptionsFeed | None = None
+) -> str:
     """
-    Retrieves and formats the latest quote for an option contract. This endpoint returns real-time
+    Retrieves and formats the latest quote for one or more option contracts. This endpoint returns real-time
     pricing and market data, including bid/ask prices, sizes, and exchange information.
 
     Args:
-        symbol (str): The option contract symbol (e.g., 'AAPL230616C00150000')
+        symbol (str | list[str]): Option contract symbol or list of symbols
+            (e.g., 'AAPL230616C00150000' or
+            ['AAPL230616C00150000', 'AAPL230616P00150000'])
         feed (Optional[OptionsFeed]): The source feed of the data (opra or indicative).
             Default: opra if the user has the options subscription, indicative otherwise.
 
@@ -1442,34 +2221,89 @@ async def get_option_latest_quote(symbol: str, feed: OptionsFeed | None = None)
         use get_option_contracts instead.
     """
     try:
-        # Create the request object
-        request = OptionLatestQuoteRequest(symbol_or_symbols=symbol, feed=feed)
-
-        # Get the latest quote
-        quotes = option_historical_data_client.get_option_latest_quote(request)
+        # One request covers every symbol, and concurrent single-symbol calls
+        # are merged into one request as well
+        quotes = await _fetch_latest_data(
+            symbol,
+            ("option_quote", feed),
+            lambda symbols: option_historical_data_client.get_option_latest_quote(
+                OptionLatestQuoteRequest(symbol_or_symbols=symbols, feed=feed)
+            ),
+        )
 
-        if symbol in quotes:
-            quote = quotes[symbol]
-            return f"""
-                Latest Quote for {symbol}:
-                ------------------------
-                Ask Price: ${float(quote.ask_price):.2f}
-                Ask Size: {quote.ask_size}
-                Ask Exchange: {quote.ask_exchange}
-                Bid Price: ${float(quote.bid_price):.2f}
-                Bid Size: {quote.bid_size}
-                Bid Exchange: {quote.bid_exchange}
-                Conditions: {quote.conditions}
-                Tape: {quote.tape}
-                Timestamp: {quote.timestamp}
-                """
-        else:
-            return f"No quote data found for {symbol}."
+        symbols = [symbol] if isinstance(symbol, str) else symbol
+        results = []
+        for sym in symbols:
+            if sym in quotes:
+                results.append(_OPTION_QUOTE_TMPL.format(symbol=sym, quote=quotes[sym]))
+            else:
+                results.append(f"No quote data found for {sym}.")
+        return "\n".join(results)
 
     except Exception as e:
         return f"Error fetching option quote: {str(e)}"
 
 
+def _format_option_snapshot(symbol: str, snapshot: Any) -> str:
+    """Render one option snapshot block, terminated by a blank line."""
+    buf = io.StringIO()
+    buf.write(f"Symbol: {symbol}\n-----------------\n")
+
+    # Latest Quote
+    if snapshot.latest_quote:
+        quote = snapshot.latest_quote
+        buf.write(
+            "Latest Quote:\n"
+            f"  Bid Price: ${quote.bid_price:.6f}\n"
+            f"  Bid Size: {quote.bid_size}\n"
+            f"  Bid Exchange: {quote.bid_exchange}\n"
+            f"  Ask Price: ${quote.ask_price:.6f}\n"
+            f"  Ask Size: {quote.ask_size}\n"
+            f"  Ask Exchange: {quote.ask_exchange}\n"
+        )
+        if quote.conditions:
+            buf.write(f"  Conditions: {quote.conditions}\n")
+        if quote.tape:
+            buf.write(f"  Tape: {quote.tape}\n")
+        buf.write(
+            f"  Timestamp: {quote.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}\n"
+        )
+
+    # Latest Trade
+    if snapshot.latest_trade:
+        trade = snapshot.latest_trade
+        buf.write(f"Latest Trade:\n  Price: ${trade.price:.6f}\n  Size: {trade.size}\n")
+        if trade.exchange:
+            buf.write(f"  Exchange: {trade.exchange}\n")
+        if trade.conditions:
+            buf.write(f"  Conditions: {trade.conditions}\n")
+        if trade.tape:
+            buf.write(f"  Tape: {trade.tape}\n")
+        if trade.id:
+            buf.write(f"  Trade ID: {trade.id}\n")
+        buf.write(
+            f"  Timestamp: {trade.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}\n"
+        )
+
+    # Implied Volatility
+    if snapshot.implied_volatility is not None:
+        buf.write(f"Implied Volatility: {snapshot.implied_volatility:.2%}\n")
+
+    # Greeks
+    if snapshot.greeks:
+        buf.write(_GREEKS_TMPL.format_map(vars(snapshot.greeks)))
+
+    buf.write("\n")
+    return buf.getvalue()
+
+
+def _format_option_snapshot_items(items: list[tuple[str, Any]]) -> str:
+    """Render a run of (symbol, snapshot) pairs back to back."""
+    return "".join(
+        _format_option_snapshot(symbol, snapshot) for symbol, snapshot in items
+    )
+
+
 @mcp.tool()
 async def get_option_snapshot(
     symbol_or_symbols: str | list[str], feed: OptionsFeed | None = None
@@ -1511,77 +2345,53 @@ async def get_option_snapshot(
         request = OptionSnapshotRequest(symbol_or_symbols=symbol_or_symbols, feed=feed)
 
         # Get snapshots
-        snapshots = option_historical_data_client.get_option_snapshot(request)
+        snapshots = await _option_snapshot_cache.get_or_fetch(
+            (
+                (
+                    symbol_or_symbols
+                    if isinstance(symbol_or_symbols, str)
+                    else tuple(symbol_or_symbols)
+                ),
+                feed,
+            ),
+            functools.partial(
+                option_historical_data_client.get_option_snapshot, request
+            ),
+        )
 
         # Format the response
-        result = "Option Snapshots:\n"
-        result += "================\n\n"
+        header = "Option Snapshots:\n================\n\n"
 
-        # Handle both single symbol and list of symbols
-        symbols = (
-            [symbol_or_symbols]
-            if isinstance(symbol_or_symbols, str)
-            else symbol_or_symbols
+        # A single symbol needs no list wrapper or loop
+        if isinstance(symbol_or_symbols, str):
+            snapshot = snapshots.get(symbol_or_symbols)
+            if snapshot is None:
+                return f"{header}No data available for {symbol_or_symbols}\n"
+            return header + _format_option_snapshot(symbol_or_symbols, snapshot)
+
+        parts = [header]
+        items = list(snapshots.items())
+        if _FREE_THREADED and len(items) >= _PARALLEL_FORMAT_MIN:
+            step = -(-len(items) // (os.cpu_count() or 1))
+            parts.extend(
+                await asyncio.gather(
+                    *(
+                        _run(_format_option_snapshot_items, items[i : i + step])
+                        for i in range(0, len(items), step)
+                    )
+                )
+            )
+        else:
+            parts.append(_format_option_snapshot_items(items))
+
+        # Requested symbols the API returned nothing for, in request order
+        parts.extend(
+            f"No data available for {symbol}\n"
+            for symbol in symbol_or_symbols
+            if symbol not in snapshots
         )
 
-        for symbol in symbols:
-            snapshot = snapshots.get(symbol)
-            if snapshot is None:
-                result += f"No data available for {symbol}\n"
-                continue
-
-            result += f"Symbol: {symbol}\n"
-            result += "-----------------\n"
-
-            # Latest Quote
-            if snapshot.latest_quote:
-                quote = snapshot.latest_quote
-                result += "Latest Quote:\n"
-                result += f"  Bid Price: ${quote.bid_price:.6f}\n"
-                result += f"  Bid Size: {quote.bid_size}\n"
-                result += f"  Bid Exchange: {quote.bid_exchange}\n"
-                result += f"  Ask Price: ${quote.ask_price:.6f}\n"
-                result += f"  Ask Size: {quote.ask_size}\n"
-                result += f"  Ask Exchange: {quote.ask_exchange}\n"
-                if quote.conditions:
-                    result += f"  Conditions: {quote.conditions}\n"
-                if quote.tape:
-                    result += f"  Tape: {quote.tape}\n"
-                result += f"  Timestamp: {quote.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}\n"
-
-            # Latest Trade
-            if snapshot.latest_trade:
-                trade = snapshot.latest_trade
-                result += "Latest Trade:\n"
-                result += f"  Price: ${trade.price:.6f}\n"
-                result += f"  Size: {trade.size}\n"
-                if trade.exchange:
-                    result += f"  Exchange: {trade.exchange}\n"
-                if trade.conditions:
-                    result += f"  Conditions: {trade.conditions}\n"
-                if trade.tape:
-                    result += f"  Tape: {trade.tape}\n"
-                if trade.id:
-                    result += f"  Trade ID: {trade.id}\n"
-                result += f"  Timestamp: {trade.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}\n"
-
-            # Implied Volatility
-            if snapshot.implied_volatility is not None:
-                result += f"Implied Volatility: {snapshot.implied_volatility:.2%}\n"
-
-            # Greeks
-            if snapshot.greeks:
-                greeks = snapshot.greeks
-                result += "Greeks:\n"
-                result += f"  Delta: {greeks.delta:.4f}\n"
-                result += f"  Gamma: {greeks.gamma:.4f}\n"
-                result += f"  Rho: {greeks.rho:.4f}\n"
-                result += f"  Theta: {greeks.theta:.4f}\n"
-                result += f"  Vega: {greeks.vega:.4f}\n"
-
-            result += "\n"
-
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Error retrieving option snapshots: {str(e)}"
@@ -1609,48 +2419,51 @@ def _validate_option_order_inputs(
 
 def _convert_order_class_string(
     order_class: str | OrderClass | None,
-) -> OrderClass | str:
+) -> OrderClass | str | None:
     """Convert order class string to enum if needed."""
-    if isinstance(order_class, str):
-        order_class_upper = order_class.upper()
-        class_mapping = {
-            "SIMPLE": OrderClass.SIMPLE,
-            "BRACKET": OrderClass.BRACKET,
-            "OCO": OrderClass.OCO,
-            "OTO": OrderClass.OTO,
-            "MLEG": OrderClass.MLEG,
-        }
-        if order_class_upper in class_mapping:
-            return class_mapping[order_class_upper]
-        else:
+    # OrderClass is a str enum, so its lower-case values double as the lookup
+    if isinstance(order_class, str) and not isinstance(order_class, OrderClass):
+        try:
+            return OrderClass(order_class.lower())
+        except ValueError:
             return f"Invalid order class: {order_class}. Must be one of: simple, bracket, oco, oto, mleg"
     return order_class
 
 
+_LEG_FIELDS = operator.itemgetter("symbol", "side", "ratio_qty")
+
+
+def _validate_option_leg(symbol: str, side: str, ratio_qty: Any) -> OrderSide | str:
+    """Validate one leg's ratio_qty and side, returning the side as an enum."""
+    if not isinstance(ratio_qty, int) or ratio_qty <= 0:
+        return f"Error: Invalid ratio_qty for leg {symbol}. Must be positive integer."
+
+    # Convert side string to enum
+    order_side = _SIDE_MAP.get(side) or _SIDE_MAP.get(side.lower())
+    if order_side is None:
+        return f"Invalid order side: {side}. Must be 'buy' or 'sell'."
+    return order_side
+
+
 def _process_option_legs(legs: list[dict[str, Any]]) -> list[OptionLegRequest] | str:
     """Convert leg dictionaries to OptionLegRequest objects."""
     order_legs = []
-    for leg in legs:
-        # Validate ratio_qty
-        if not isinstance(leg["ratio_qty"], int) or leg["ratio_qty"] <= 0:
-            return f"Error: Invalid ratio_qty for leg {leg['symbol']}. Must be positive integer."
-
-        # Convert side string to enum
-        if leg["side"].lower() == "buy":
-            order_side = OrderSide.BUY
-        elif leg["side"].lower() == "sell":
-            order_side = OrderSide.SELL
-        else:
-            return f"Invalid order side: {leg['side']}. Must be 'buy' or 'sell'."
+    for symbol, side, ratio_qty in map(_LEG_FIELDS, legs):
+        order_side = _validate_option_leg(symbol, side, ratio_qty)
+        if not isinstance(order_side, OrderSide):  # Error message returned
+            return order_side
 
         order_legs.append(
-            OptionLegRequest(
-                symbol=leg["symbol"], side=order_side, ratio_qty=leg["ratio_qty"]
-            )
+            OptionLegRequest(symbol=symbol, side=order_side, ratio_qty=ratio_qty)
         )
     return order_legs
 
 
+def _make_option_client_order_id() -> str:
+    """Return a client_order_id that is unique even within one clock tick."""
+    return f"mcp_opt_{time.time_ns()}_{next(_ORDER_SEQ)}"
+
+
 def _create_option_market_order_request(
     order_legs: list[OptionLegRequest],
     order_class: OrderClass,
@@ -1659,73 +2472,62 @@ def _create_option_market_order_request(
     extended_hours: bool,
 ) -> MarketOrderRequest:
     """Create the appropriate MarketOrderRequest based on order class."""
+    common: dict[str, Any] = {
+        "qty": quantity,
+        "order_class": order_class,
+        "time_in_force": time_in_force,
+        "extended_hours": extended_hours,
+        "client_order_id": _make_option_client_order_id(),
+        "type": OrderType.MARKET,
+    }
     if order_class == OrderClass.MLEG:
-        return MarketOrderRequest(
-            qty=quantity,
-            order_class=order_class,
-            time_in_force=time_in_force,
-            extended_hours=extended_hours,
-            client_order_id=f"mcp_opt_{int(time.time())}",
-            type=OrderType.MARKET,
-            legs=order_legs,
-        )
-    else:
-        # For single-leg orders
-        return MarketOrderRequest(
-            symbol=order_legs[0].symbol,
-            qty=quantity,
-            side=order_legs[0].side,
-            order_class=order_class,
-            time_in_force=time_in_force,
-            extended_hours=extended_hours,
-            client_order_id=f"mcp_opt_{int(time.time())}",
-            type=OrderType.MARKET,
-        )
+        return MarketOrderRequest(legs=order_legs, **common)
+    # For single-leg orders
+    return MarketOrderRequest(
+        symbol=order_legs[0].symbol, side=order_legs[0].side, **common
+    )
 
 
 def _format_option_order_response(
     order: Order, order_class: OrderClass, order_legs: list[OptionLegRequest]
 ) -> str:
     """Format the successful order response."""
-    result = f"""
-            Option Market Order Placed Successfully:
-            --------------------------------------
-            Order ID: {order.id}
-            Client Order ID: {order.client_order_id}
-            Order Class: {order.order_class}
-            Order Type: {order.type}
-            Time In Force: {order.time_in_force}
-            Status: {order.status}
-            Quantity: {order.qty}
-            Created At: {order.created_at}
-            Updated At: {order.updated_at}
-            """
+    buf = io.StringIO()
+    buf.write(_OPTION_ORDER_TMPL.format(order=order))
 
     if order_class == OrderClass.MLEG and order.legs:
-        result += "\nLegs:\n"
+        buf.write("\nLegs:\n")
         for leg in order.legs:
-            result += f"""
-                    Symbol: {leg.symbol}
-                    Side: {leg.side}
-                    Ratio Quantity: {leg.ratio_qty}
-                    Status: {leg.status}
-                    Asset Class: {leg.asset_class}
-                    Created At: {leg.created_at}
-                    Updated At: {leg.updated_at}
-                    Filled Price: {leg.filled_avg_price if hasattr(leg, 'filled_avg_price') else 'Not filled'}
-                    Filled Time: {leg.filled_at if hasattr(leg, 'filled_at') else 'Not filled'}
-                    -------------------------
-                    """
+            buf.write(
+                _OPTION_ORDER_LEG_TMPL.format(
+                    leg=leg,
+                    filled_price=(
+                        leg.filled_avg_price if _HAS_ORDER_FILL_FIELDS else "Not filled"
+                    ),
+                    filled_at=leg.filled_at if _HAS_ORDER_FILL_FIELDS else "Not filled",
+                )
+            )
     else:
-        result += f"""
-                Symbol: {order.symbol}
-                Side: {order_legs[0].side}
-                Filled Price: {order.filled_avg_price if hasattr(order, 'filled_avg_price') else 'Not filled'}
-                Filled Time: {order.filled_at if hasattr(order, 'filled_at') else 'Not filled'}
-                -------------------------
-                """
+        buf.write(
+            _OPTION_ORDER_FILL_TMPL.format(
+                order=order,
+                filled_price=(
+                    order.filled_avg_price if _HAS_ORDER_FILL_FIELDS else "Not filled"
+                ),
+                filled_at=order.filled_at if _HAS_ORDER_FILL_FIELDS else "Not filled",
+            )
+        )
 
-    return result
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_occ(symbol: str) -> tuple[str, str, str, str]:
+    """Split an OCC option symbol into (root, YYMMDD expiry, C/P, strike).
+
+    The last 15 characters have a fixed layout, so this is plain slicing.
+    """
+    return symbol[:-15], symbol[-15:-9], symbol[-9:-8], symbol[-8:]
 
 
 def _analyze_option_strategy_type(
@@ -1743,29 +2545,27 @@ def _analyze_option_strategy_type(
         )
 
         if both_short:
-            # Check for short straddle (same strike, same expiration, both short)
-            if order_legs[0].symbol.split("C")[0] == order_legs[1].symbol.split("P")[0]:
+            root1, exp1, type1, strike1 = _parse_occ(order_legs[0].symbol)
+            root2, exp2, type2, strike2 = _parse_occ(order_legs[1].symbol)
+
+            # Check for short straddle (call and put, same strike, same expiration)
+            if (root1, exp1, strike1) == (root2, exp2, strike2) and type1 != type2:
                 is_short_straddle = True
             else:
                 is_short_strangle = True
 
-            # Check for short calendar spread (same strike, different expirations, both short)
-            leg1_type = "C" if "C" in order_legs[0].symbol else "P"
-            leg2_type = "C" if "C" in order_legs[1].symbol else "P"
-
-            if leg1_type == "C" and leg2_type == "C":
-                leg1_exp = order_legs[0].symbol.split(leg1_type)[1][:6]
-                leg2_exp = order_legs[1].symbol.split(leg2_type)[1][:6]
-                if leg1_exp != leg2_exp:
-                    is_short_calendar = True
-                    is_short_strangle = False  # Override strangle detection
+            # Check for short calendar spread (both calls, different expirations)
+            if type1 == type2 == "C" and exp1 != exp2:
+                is_short_calendar = True
+                is_short_strangle = False  # Override strangle detection
 
     return is_short_straddle, is_short_strangle, is_short_calendar
 
 
-def _get_short_straddle_error_message() -> str:
-    """Get error message for short straddle permission issues."""
-    return """
+# Permission-error explanations for option orders, keyed by the strategy
+# _analyze_option_strategy_type detects ("uncovered" when none matches)
+_OPTION_ERROR_MESSAGES = {
+    "short_straddle": """
     Error: Account not eligible to trade short straddles.
 
     This error occurs because short straddles require Level 4 options trading permission.
@@ -1782,12 +2582,8 @@ def _get_short_straddle_error_message() -> str:
     - Consider using a long straddle instead
     - Use a debit spread strategy
     - Implement a covered call or cash-secured put
-    """
-
-
-def _get_short_strangle_error_message() -> str:
-    """Get error message for short strangle permission issues."""
-    return """
+    """,
+    "short_strangle": """
     Error: Account not eligible to trade short strangles.
 
     This error occurs because short strangles require Level 4 options trading permission.
@@ -1804,12 +2600,8 @@ def _get_short_strangle_error_message() -> str:
     - Consider using a long strangle instead
     - Use a debit spread strategy
     - Implement a covered call or cash-secured put
-    """
-
-
-def _get_short_calendar_error_message() -> str:
-    """Get error message for short calendar spread permission issues."""
-    return """
+    """,
+    "short_calendar": """
     Error: Account not eligible to trade short calendar spreads.
 
     This error occurs because short calendar spreads require Level 4 options trading permission.
@@ -1826,12 +2618,8 @@ def _get_short_calendar_error_message() -> str:
     - Consider using a long calendar spread instead
     - Use a debit spread strategy
     - Implement a covered call or cash-secured put
-    """
-
-
-def _get_uncovered_options_error_message() -> str:
-    """Get error message for uncovered options permission issues."""
-    return """
+    """,
+    "uncovered": """
     Error: Account not eligible to trade uncovered option contracts.
 
     This error occurs when attempting to place an order that could result in an uncovered position.
@@ -1848,7 +2636,8 @@ def _get_uncovered_options_error_message() -> str:
     - Consider using covered calls instead of naked calls
     - Use debit spreads instead of calendar spreads
     - Ensure all positions are properly hedged
-    """
+    """,
+}
 
 
 def _handle_option_api_error(
@@ -1866,13 +2655,14 @@ def _handle_option_api_error(
         ) = _analyze_option_strategy_type(order_legs, order_class)
 
         if is_short_straddle:
-            return _get_short_straddle_error_message()
+            strategy = "short_straddle"
         elif is_short_strangle:
-            return _get_short_strangle_error_message()
+            strategy = "short_strangle"
         elif is_short_calendar:
-            return _get_short_calendar_error_message()
+            strategy = "short_calendar"
         else:
-            return _get_uncovered_options_error_message()
+            strategy = "uncovered"
+        return _OPTION_ERROR_MESSAGES[strategy]
     elif "403" in error_message:
         return f"""
         Error: Permission denied for option trading.
@@ -1906,6 +2696,55 @@ def _handle_option_api_error(
 # ============================================================================
 
 
+async def _submit_option_order(order_data: MarketOrderRequest) -> Order:
+    """Submit an option order and drop the caches it invalidates."""
+    order = await _run(trade_client.submit_order, order_data)
+    _account_cache.clear()
+    _option_snapshot_cache.clear()
+    # trade_client is built without raw_data, so the SDK returns a model
+    assert isinstance(order, Order)
+    return order
+
+
+# order_class values that mean a plain single-leg order (OrderClass is a str enum)
+_SIMPLE_ORDER_CLASSES = (None, "simple", "SIMPLE")
+
+
+async def _place_single_leg_option_order(
+    leg: dict[str, Any],
+    quantity: int,
+    time_in_force: TimeInForce,
+    extended_hours: bool,
+) -> str:
+    """Place a single-leg "simple" option market order.
+
+    Uses the same validators as the general path in place_option_market_order,
+    but builds the request directly without resolving an order class or leg
+    list. API errors propagate to the caller.
+    """
+    validation_error = _validate_option_order_inputs([leg], quantity, time_in_force)
+    if validation_error:
+        return validation_error
+
+    symbol, side, ratio_qty = _LEG_FIELDS(leg)
+    order_side = _validate_option_leg(symbol, side, ratio_qty)
+    if not isinstance(order_side, OrderSide):  # Error message returned
+        return order_side
+
+    order_data = MarketOrderRequest(
+        symbol=symbol,
+        qty=quantity,
+        side=order_side,
+        order_class=OrderClass.SIMPLE,
+        time_in_force=time_in_force,
+        extended_hours=extended_hours,
+        client_order_id=_make_option_client_order_id(),
+        type=OrderType.MARKET,
+    )
+    order = await _submit_option_order(order_data)
+    return _format_option_order_response(order, OrderClass.SIMPLE, [])
+
+
 @mcp.tool()
 async def place_option_market_order(
     legs: list[dict[str, Any]],
@@ -1965,6 +2804,12 @@ async def place_option_market_order(
     order_legs: list[OptionLegRequest] = []
 
     try:
+        # Most orders are one leg with the default class; skip the general path
+        if len(legs) == 1 and order_class in _SIMPLE_ORDER_CLASSES:
+            return await _place_single_leg_option_order(
+                legs[0], quantity, time_in_force, extended_hours
+            )
+
         # Validate inputs
         validation_error = _validate_option_order_inputs(legs, quantity, time_in_force)
         if validation_error:
@@ -1976,9 +2821,8 @@ async def place_option_market_order(
             order_class = converted_order_class
         elif isinstance(converted_order_class, str):  # Error message returned
             return converted_order_class
-
-        # Determine order class if not provided
-        if order_class is None:
+        else:
+            # Determine order class if not provided
             order_class = OrderClass.MLEG if len(legs) > 1 else OrderClass.SIMPLE
 
         # Process legs
@@ -1993,7 +2837,7 @@ async def place_option_market_order(
         )
 
         # Submit order
-        order = trade_client.submit_order(order_data)
+        order = await _submit_option_order(order_data)
 
         # Format and return response
         return _format_option_order_response(order, order_class, order_legs)
@@ -2013,6 +2857,13 @@ async def place_option_market_order(
         """
 
 
+@functools.lru_cache(maxsize=32)
+def _make_timeframe(amount: int, unit: TimeFrameUnit) -> TimeFrame:
+    """Return one shared TimeFrame per (amount, unit), e.g. for "5Min" and "5min"."""
+    return TimeFrame(amount, unit)
+
+
+@functools.lru_cache(maxsize=64)
 def parse_timeframe_with_enums(timeframe_str: str) -> TimeFrame | None:
     """
     Parse timeframe string to Alpaca TimeFrame object using proper enumerations.
@@ -2032,56 +2883,24 @@ def parse_timeframe_with_enums(timeframe_str: str) -> TimeFrame | None:
         timeframe_str = timeframe_str.strip()
 
         # Use predefined TimeFrame objects for common cases (more efficient)
-        predefined_timeframes = {
-            "1Min": TimeFrame.Minute,
-            "1Hour": TimeFrame.Hour,
-            "1Day": TimeFrame.Day,
-            "1Week": TimeFrame.Week,
-            "1Month": TimeFrame.Month,
-        }
-
-        if timeframe_str in predefined_timeframes:
-            return predefined_timeframes[timeframe_str]
-
-        # Flexible regex pattern to parse any valid timeframe format
-        # Matches: <number><unit> where unit can be Min, Hour, Day, Week, Month
-        pattern = r"^(\d+)(Min|Hour|Day|Week|Month)$"
-        match = re.match(pattern, timeframe_str, re.IGNORECASE)
+        predefined = _PREDEFINED_TIMEFRAMES.get(timeframe_str)
+        if predefined is not None:
+            return predefined
 
+        match = _TIMEFRAME_RE.match(timeframe_str)
         if not match:
             return None
 
         amount = int(match.group(1))
-        unit_str = match.group(2).lower()
-
-        # Map unit strings to TimeFrameUnit enums
-        unit_mapping = {
-            "min": TimeFrameUnit.Minute,
-            "hour": TimeFrameUnit.Hour,
-            "day": TimeFrameUnit.Day,
-            "week": TimeFrameUnit.Week,
-            "month": TimeFrameUnit.Month,
-        }
-
-        unit = unit_mapping.get(unit_str)
+        unit = _TIMEFRAME_UNITS.get(match.group(2).lower())
         if unit is None:
             return None
 
         # Validate amount based on unit type
-        if unit == TimeFrameUnit.Minute and amount > 59:
-            # Minutes should be reasonable (1-59)
-            return None
-        elif unit == TimeFrameUnit.Hour and amount > 23:
-            # Hours should be reasonable (1-23)
-            return None
-        elif (
-            unit in [TimeFrameUnit.Day, TimeFrameUnit.Week, TimeFrameUnit.Month]
-            and amount > 365
-        ):
-            # Days/weeks/months should be reasonable
+        if amount > _TIMEFRAME_UNIT_LIMITS[unit]:
             return None
 
-        return TimeFrame(amount, unit)
+        return _make_timeframe(amount, unit)
 
     except (ValueError, AttributeError, TypeError):
         return None
@@ -2094,6 +2913,10 @@ def main() -> None:
     It's called when the package is installed and run via the 'alpaca-mcp-server' command.
     """
     try:
+        # Installed here rather than at import so embedding the module does
+        # not change the host application's event loop policy
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         mcp.run(transport="stdio")
     except Exception as e:
         print(f"Error starting Alpaca MCP server: {e}", file=sys.stderr)
@@ -35,6 +35,15 @@ else
     echo "   💡 Run 'ruff check .' to see details"
 fi
 
+# Pytest
+echo "4. 🧪 PYTEST (tests):"
+if python -m pytest -q > /dev/null 2>&1; then
+    echo "   ✅ PASSED - All tests pass! ✔️"
+else
+    echo "   ❌ FAILED - Tests failing 🐛"
+    echo "   💡 Run 'python -m pytest' to see details"
+fi
+
 echo
 echo "════════════════════════════════════"
 echo "🚀 To auto-fix issues, run: ./quality-fix.sh"
\ No newline at end of file
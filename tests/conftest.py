@@ -0,0 +1,6 @@
+import os
+
+# The server builds its SDK clients at import time and refuses to start
+# without credentials; tests never reach the network, so dummies are enough
+os.environ.setdefault("ALPACA_API_KEY", "test-key")
+os.environ.setdefault("ALPACA_SECRET_KEY", "test-secret")
@@ -0,0 +1,87 @@
+import asyncio
+import types
+from typing import Any
+
+import pytest
+
+import alpaca_mcp_server as server
+
+
+def _api_error(status: int, message: str) -> server.APIError:
+    http_error = types.SimpleNamespace(
+        response=types.SimpleNamespace(status_code=status)
+    )
+    return server.APIError(f'{{"code": 0, "message": "{message}"}}', http_error)
+
+
+class FakeLatest:
+    """Latest-data fetch that records each SDK call's symbol list."""
+
+    def __init__(self, error: Exception | None = None, trigger: str = "") -> None:
+        self.error = error
+        self.trigger = trigger
+        self.calls: list[list[str]] = []
+
+    def __call__(self, symbols: list[str]) -> dict[str, Any]:
+        self.calls.append(list(symbols))
+        if self.error is not None and self.trigger in symbols:
+            raise self.error
+        return {symbol: f"data-{symbol}" for symbol in symbols if symbol != "NONE"}
+
+
+def _gather(fetch: FakeLatest, symbols: list[str]) -> list[Any]:
+    coalescer = server._RequestCoalescer()
+
+    async def scenario() -> list[Any]:
+        results = await asyncio.gather(
+            *(coalescer.fetch(symbol, "key", fetch) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return list(results)
+
+    return asyncio.run(scenario())
+
+
+def test_concurrent_symbols_share_one_request() -> None:
+    fetch = FakeLatest()
+    results = _gather(fetch, ["AAPL", "MSFT", "AAPL", "NONE"])
+
+    assert fetch.calls == [["AAPL", "MSFT", "NONE"]]
+    assert results == [
+        {"AAPL": "data-AAPL"},
+        {"MSFT": "data-MSFT"},
+        {"AAPL": "data-AAPL"},
+        {},
+    ]
+
+
+def test_bad_symbol_only_fails_its_own_caller() -> None:
+    error = _api_error(400, "invalid symbol: BAD!")
+    fetch = FakeLatest(error, trigger="BAD!")
+    results = _gather(fetch, ["AAPL", "BAD!", "MSFT"])
+
+    assert results == [{"AAPL": "data-AAPL"}, error, {"MSFT": "data-MSFT"}]
+    assert fetch.calls[0] == ["AAPL", "BAD!", "MSFT"]
+    assert sorted(fetch.calls[1:]) == [["AAPL"], ["BAD!"], ["MSFT"]]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [_api_error(429, "rate limit exceeded"), ConnectionError("connection reset")],
+)
+def test_other_errors_reach_every_caller_without_retry(error: Exception) -> None:
+    fetch = FakeLatest(error, trigger="AAPL")
+    results = _gather(fetch, ["AAPL", "MSFT"])
+
+    assert results == [error, error]
+    assert fetch.calls == [["AAPL", "MSFT"]]
+
+
+def test_symbol_lists_bypass_the_coalescer() -> None:
+    fetch = FakeLatest()
+
+    async def scenario() -> dict[str, Any]:
+        return await server._fetch_latest_data(["AAPL", "MSFT"], "key", fetch)
+
+    assert asyncio.run(scenario()) == {"AAPL": "data-AAPL", "MSFT": "data-MSFT"}
+    assert fetch.calls == [["AAPL", "MSFT"]]
@@ -0,0 +1,127 @@
+import asyncio
+import types
+from typing import Any
+
+import pytest
+
+import alpaca_mcp_server as server
+
+
+class FakeStreamClient:
+    """Stands in for StockDataStream: records (un)subscriptions, streams nothing."""
+
+    def __init__(self, fail_subscribe: bool = False) -> None:
+        self.fail_subscribe = fail_subscribe
+        self.subscribed: list[str] = []
+        self.unsubscribed: list[str] = []
+        self.handler: Any = None
+
+    def subscribe_bars(self, handler: Any, symbol: str) -> None:
+        if self.fail_subscribe:
+            raise ValueError(f"invalid symbol: {symbol}")
+        self.handler = handler
+        self.subscribed.append(symbol)
+
+    def unsubscribe_bars(self, symbol: str) -> None:
+        self.unsubscribed.append(symbol)
+
+    async def _run_forever(self) -> None:
+        await asyncio.Event().wait()
+
+    async def stop_ws(self) -> None:
+        pass
+
+
+@pytest.fixture
+def stream(monkeypatch: pytest.MonkeyPatch) -> server._StockBarStream:
+    bar_stream = server._StockBarStream()
+    monkeypatch.setattr(server, "_stock_bar_stream", bar_stream)
+    return bar_stream
+
+
+def _use_client(monkeypatch: pytest.MonkeyPatch, client: FakeStreamClient) -> None:
+    monkeypatch.setattr(server, "_get_stock_data_stream_client", lambda: client)
+
+
+def _bar(symbol: str) -> Any:
+    return types.SimpleNamespace(symbol=symbol)
+
+
+def test_subscribers_share_one_sdk_subscription(
+    monkeypatch: pytest.MonkeyPatch, stream: server._StockBarStream
+) -> None:
+    client = FakeStreamClient()
+    _use_client(monkeypatch, client)
+
+    async def scenario() -> None:
+        async with stream.subscribe("AAPL") as first:
+            async with stream.subscribe("AAPL") as second:
+                assert client.subscribed == ["AAPL"]
+                bar = _bar("AAPL")
+                await client.handler(bar)
+                assert first.get_nowait() is bar
+                assert second.get_nowait() is bar
+            assert client.unsubscribed == []
+        assert client.unsubscribed == ["AAPL"]
+        await stream.close()
+
+    asyncio.run(scenario())
+
+
+def test_live_bars_tool_calls_share_the_stream(
+    monkeypatch: pytest.MonkeyPatch, stream: server._StockBarStream
+) -> None:
+    client = FakeStreamClient()
+    _use_client(monkeypatch, client)
+    bar = types.SimpleNamespace(
+        symbol="AAPL",
+        timestamp=server.datetime(2025, 1, 2, 15, 30),
+        open=1.0,
+        high=2.0,
+        low=0.5,
+        close=1.5,
+        volume=100,
+    )
+    get_stock_live_bars = getattr(
+        server.get_stock_live_bars, "fn", server.get_stock_live_bars
+    )
+
+    async def scenario() -> list[str]:
+        calls = asyncio.gather(
+            get_stock_live_bars("AAPL", timeout_seconds=5),
+            get_stock_live_bars("AAPL", timeout_seconds=5),
+        )
+        while len(stream._subscribers.get("AAPL", ())) < 2:
+            await asyncio.sleep(0)
+        await client.handler(bar)
+        results = await calls
+        await stream.close()
+        return list(results)
+
+    results = asyncio.run(scenario())
+    assert client.subscribed == ["AAPL"]
+    assert client.unsubscribed == ["AAPL"]
+    for result in results:
+        assert result.startswith("Live Minute Bars for AAPL:")
+        assert "Close: $1.50" in result
+
+
+def test_failed_subscribe_does_not_leak_its_queue(
+    monkeypatch: pytest.MonkeyPatch, stream: server._StockBarStream
+) -> None:
+    client = FakeStreamClient(fail_subscribe=True)
+    _use_client(monkeypatch, client)
+
+    async def scenario() -> None:
+        with pytest.raises(ValueError):
+            async with stream.subscribe("BAD!"):
+                pass
+        assert stream._subscribers == {}
+
+        # The next caller must register with the SDK again
+        client.fail_subscribe = False
+        async with stream.subscribe("BAD!"):
+            assert client.subscribed == ["BAD!"]
+        await stream.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Any
+
+import alpaca_mcp_server as server
+
+
+@server._tool_safe("cancelling order {order_id}")
+async def _cancel(order_id: str, force: bool = False) -> str:
+    if force:
+        raise RuntimeError("order not found")
+    return f"cancelled {order_id}"
+
+
+def _call(*args: Any, **kwargs: Any) -> str:
+    async def scenario() -> str:
+        return await _cancel(*args, **kwargs)
+
+    return asyncio.run(scenario())
+
+
+def test_result_passes_through() -> None:
+    assert _call("abc") == "cancelled abc"
+
+
+def test_exception_becomes_labelled_error_reply() -> None:
+    assert _call(order_id="abc", force=True) == (
+        "Error cancelling order abc: order not found"
+    )
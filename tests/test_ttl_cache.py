@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import types
+from typing import Any
+
+import pytest
+
+import alpaca_mcp_server as server
+
+
+class Clock:
+    """Manually advanced stand-in for time.monotonic inside the server module."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    fake = Clock()
+    # Patch only the server's view of ``time`` so the event loop keeps real time
+    monkeypatch.setattr(server, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+class CountingFetch:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+def test_hit_within_ttl_skips_fetch(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=4, ttl=5.0)
+    fetch = CountingFetch()
+
+    async def scenario() -> list[Any]:
+        first = await cache.get_or_fetch("key", fetch)
+        clock.now += 4.9
+        return [first, await cache.get_or_fetch("key", fetch)]
+
+    assert asyncio.run(scenario()) == [1, 1]
+    assert fetch.calls == 1
+
+
+def test_expired_entry_is_refetched(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=4, ttl=5.0)
+    fetch = CountingFetch()
+
+    async def scenario() -> list[Any]:
+        first = await cache.get_or_fetch("key", fetch)
+        clock.now += 5.0
+        return [first, await cache.get_or_fetch("key", fetch)]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_least_recently_used_entry_is_evicted(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=2, ttl=5.0)
+
+    async def scenario() -> None:
+        await cache.get_or_fetch("a", lambda: "a")
+        await cache.get_or_fetch("b", lambda: "b")
+        await cache.get_or_fetch("a", lambda: "unused")
+        await cache.get_or_fetch("c", lambda: "c")
+
+    asyncio.run(scenario())
+    assert list(cache._entries) == ["a", "c"]
+
+
+def test_concurrent_misses_share_one_fetch(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=4, ttl=5.0)
+    release = threading.Event()
+    fetch = CountingFetch()
+
+    def slow_fetch() -> int:
+        release.wait(5)
+        return fetch()
+
+    async def scenario() -> list[Any]:
+        waiters = asyncio.gather(
+            *(cache.get_or_fetch("key", slow_fetch) for _ in range(3))
+        )
+        await asyncio.sleep(0.01)
+        release.set()
+        return list(await waiters)
+
+    assert asyncio.run(scenario()) == [1, 1, 1]
+    assert fetch.calls == 1
+
+
+def test_clear_during_fetch_discards_the_stale_result(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=4, ttl=5.0)
+    release = threading.Event()
+    fetch = CountingFetch()
+
+    def slow_fetch() -> int:
+        release.wait(5)
+        return fetch()
+
+    async def scenario() -> list[Any]:
+        pending = asyncio.ensure_future(cache.get_or_fetch("key", slow_fetch))
+        await asyncio.sleep(0.01)
+        cache.clear()
+        release.set()
+        # The waiter still gets its answer, but it must not be cached
+        first = await pending
+        return [first, await cache.get_or_fetch("key", fetch)]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_failed_fetch_is_not_cached(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=4, ttl=5.0)
+
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    async def scenario() -> Any:
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("key", broken)
+        return await cache.get_or_fetch("key", lambda: "ok")
+
+    assert asyncio.run(scenario()) == "ok"
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_fetch(clock: Clock) -> None:
+    cache = server._TTLCache(maxsize=4, ttl=5.0)
+    release = threading.Event()
+
+    def slow_fetch() -> str:
+        release.wait(5)
+        return "value"
+
+    async def scenario() -> Any:
+        first = asyncio.ensure_future(cache.get_or_fetch("key", slow_fetch))
+        second = asyncio.ensure_future(cache.get_or_fetch("key", slow_fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        release.set()
+        return await second
+
+    assert asyncio.run(scenario()) == "value"